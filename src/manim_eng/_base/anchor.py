@@ -6,64 +6,87 @@ mark
 """
 
 import abc
+import functools
 
 import manim as mn
 import manim.typing as mnt
-import numpy as np
 
 from manim_eng._config import config_eng
 
 __all__ = ["Anchor"]
 
 
-class Anchor(mn.Arc, metaclass=abc.ABCMeta):
+class Anchor(mn.VectorizedPoint, metaclass=abc.ABCMeta):
     """Anchor to which Marks can be attached.
 
+    Anchors are invisible points, unless debug mode is enabled, in which case a ring is
+    drawn around them.
+
     See Also
     --------
     mark.Mark
     """
 
-    def __init__(self, colour: mn.ManimColor) -> None:
-        super().__init__(
-            config_eng.anchor.radius if config_eng.debug else 0,
-            start_angle=0,
-            angle=2 * mn.PI,
-            color=colour,
-            stroke_width=config_eng.anchor.stroke_width,
-            z_index=100,
+    _colour_attribute: str
+    """Name of the ``config_eng.anchor`` attribute holding the debug ring colour."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        if config_eng.debug:
+            self._build_visual()
+
+    def _build_visual(self) -> None:
+        """Add the ring used to visualise the anchor in debug mode."""
+        # The colour is only looked up here, rather than on every construction, as it
+        # is irrelevant outside of debug mode
+        ring = _get_ring_prototype(
+            config_eng.anchor.radius,
+            config_eng.anchor.stroke_width,
+            getattr(config_eng.anchor, self._colour_attribute),
         )
+        self.add(ring.copy().move_to(self.get_location()))
 
     @property
     def pos(self) -> mnt.Point3D:
-        return np.array(self.get_center())
+        # The anchor is a single point, so there is no need to compute the bounding
+        # box of the whole family (which includes the debug ring, if present)
+        return self.get_location()
+
+
+@functools.lru_cache(maxsize=16)
+def _get_ring_prototype(
+    radius: float, stroke_width: float, colour: mn.ManimColor
+) -> mn.Arc:
+    # Keyed on the display configuration so that changes to it produce new prototypes
+    return mn.Arc(
+        radius,
+        start_angle=0,
+        angle=2 * mn.PI,
+        color=colour,
+        stroke_width=stroke_width,
+        z_index=100,
+    )
 
 
 class AnnotationAnchor(Anchor):
-    def __init__(self) -> None:
-        super().__init__(config_eng.anchor.annotation_colour)
+    _colour_attribute = "annotation_colour"
 
 
 class CentreAnchor(Anchor):
-    def __init__(self) -> None:
-        super().__init__(config_eng.anchor.centre_colour)
+    _colour_attribute = "centre_colour"
 
 
 class CurrentAnchor(Anchor):
-    def __init__(self) -> None:
-        super().__init__(config_eng.anchor.current_colour)
+    _colour_attribute = "current_colour"
 
 
 class LabelAnchor(Anchor):
-    def __init__(self) -> None:
-        super().__init__(config_eng.anchor.label_colour)
+    _colour_attribute = "label_colour"
 
 
 class TerminalAnchor(Anchor):
-    def __init__(self) -> None:
-        super().__init__(config_eng.anchor.terminal_colour)
+    _colour_attribute = "terminal_colour"
 
 
 class VoltageAnchor(Anchor):
-    def __init__(self) -> None:
-        super().__init__(config_eng.anchor.voltage_colour)
+    _colour_attribute = "voltage_colour"
@@ -5,7 +5,9 @@ See Also
 anchor, markable
 """
 
-from typing import Any, Callable, Self
+import dataclasses as dc
+import functools
+from typing import Any, Self
 
 import manim as mn
 
@@ -34,15 +36,22 @@ class Mark(mn.VMobject):
 
     def __init__(self, anchor: Anchor, centre_reference: Anchor) -> None:
         super().__init__()
-        self.mathtex: mn.MathTex = mn.MathTex("")
-
-        self.updater: Callable[[mn.Mobject], None]
+        self.mathtex: mn.MathTex = _get_mathtex(("",), mn.DEFAULT_FONT_SIZE)
+
+        self.__anchor: Anchor
+        self.__centre_reference: Anchor
+        # The positions of the anchors and the mark's centre when it was last
+        # positioned
+        self.__positioned_at: tuple[list[float], ...] | None = None
+        # The plain function is registered (rather than a bound method or closure) so
+        # that copies of the mark follow their own anchors, not the original's
+        self.add_updater(Mark.__follow_anchors)
         self.change_anchors(anchor, centre_reference)
 
     def set_text(
         self,
         *args: Any,
-        font_size: float = config_eng.symbol.mark_font_size,
+        font_size: float | None = None,
         **kwargs: Any,
     ) -> Self:
         """Set the text of the mark.
@@ -53,16 +62,24 @@ class Mark(mn.VMobject):
             Positional arguments to be pass on to ``manim.MathTex``. The most important
             of these is ``*tex_strings``, i.e. the actual TeX math mode strings to use
             as the mark's text.
-        font_size : float
+        font_size : float | None
             The font size to use for the mark. Leaving it empty adopts the default
-            (recommended).
+            from the configuration at the time of the call (recommended).
         **kwargs : Any
             Keyword arguments to pass on to ``manim.MathTex``.
         """
+        if font_size is None:
+            font_size = config_eng.symbol.mark_font_size
         if self.mathtex in self.submobjects:
             self.remove(self.mathtex)
-        self.mathtex = mn.MathTex(*args, font_size=font_size, **kwargs)
+        if not kwargs and all(isinstance(arg, str) for arg in args):
+            self.mathtex = _get_mathtex(args, font_size)
+        else:
+            self.mathtex = mn.MathTex(*args, font_size=font_size, **kwargs)
         self.add(self.mathtex)
+        # The new text may be a different size, so must be repositioned even if its
+        # centre happens to match the old one's
+        self.__positioned_at = None
         self._reposition()
         return self
 
@@ -78,10 +95,14 @@ class Mark(mn.VMobject):
             ``anchor``, attached to the side directly opposite the side
             ``centre_reference`` is on.
         """
-        if len(self.updaters) != 0:
-            self.remove_updater(self.updater)
-        self.updater = self.__get_updater(anchor, centre_reference)
-        self.add_updater(self.updater)
+        if (anchor.pos == centre_reference.pos).all():
+            raise ValueError(
+                "`anchor` and `centre_reference` cannot be the same. "
+                f"Found: {anchor.pos=}, {centre_reference.pos=}.\n"
+                "Please report this error to a developer."
+            )
+        self.__anchor = anchor
+        self.__centre_reference = centre_reference
         self.update()
 
     @property
@@ -103,27 +124,69 @@ class Mark(mn.VMobject):
         else:
             self.update()
 
-    @staticmethod
-    def __get_updater(
-        anchor: Anchor, centre_reference: Anchor
-    ) -> Callable[[mn.Mobject], None]:
-        if (anchor.pos == centre_reference.pos).all():
-            raise ValueError(
-                "`anchor` and `centre_reference` cannot be the same. "
-                f"Found: {anchor.pos=}, {centre_reference.pos=}.\n"
-                "Please report this error to a developer."
-            )
+    def __follow_anchors(self) -> None:
+        # If neither anchor nor the mark itself has moved since the mark was last
+        # positioned, it is still in the right place
+        anchor_position = self.__anchor.pos
+        centre_reference_position = self.__centre_reference.pos
+        positioned_at = (
+            anchor_position.tolist(),
+            centre_reference_position.tolist(),
+            self.get_center().tolist(),
+        )
+        if positioned_at == self.__positioned_at:
+            return
+
+        line_of_connection = utils.normalised(
+            anchor_position - centre_reference_position
+        )
+        line_of_connection = utils.cardinalised(
+            line_of_connection, config_eng.symbol.mark_cardinal_alignment_margin
+        )
+        self.next_to(
+            mobject_or_point=anchor_position,
+            direction=line_of_connection,
+            buff=mn.SMALL_BUFF,
+        )
+        self.__positioned_at = (*positioned_at[:2], self.get_center().tolist())
+
+
+def _get_mathtex(tex_strings: tuple[str, ...], font_size: float) -> mn.MathTex:
+    """Return a new ``MathTex`` of ``tex_strings`` at ``font_size``.
+
+    The ``MathTex`` is copied from a cached prototype rather than constructed afresh,
+    as construction means running (or at least looking up the output of) LaTeX and
+    parsing the resulting SVG, and the same labels tend to be set over and over.
+    """
+    tex_template = mn.config.tex_template
+    template_key = _TexTemplateKey(
+        tex_template.body,
+        tex_template.tex_compiler,
+        tex_template.output_format,
+        tex_template,
+    )
+    return _get_mathtex_prototype(tex_strings, font_size, template_key).copy()
+
+
+@dc.dataclass(frozen=True)
+class _TexTemplateKey:
+    """A hashable stand-in for a ``TexTemplate`` in the prototype cache.
+
+    ``TexTemplate`` is not necessarily hashable, so prototypes are keyed on the
+    parts of it that affect the output, with the template itself carried along (but
+    not compared) so it can be passed on to ``MathTex``.
+    """
+
+    body: str
+    tex_compiler: str
+    output_format: str
+    template: mn.TexTemplate = dc.field(compare=False, hash=False)
 
-        def updater(mark: mn.Mobject) -> None:
-            line_of_connection = anchor.pos - centre_reference.pos
-            line_of_connection = mn.normalize(line_of_connection)
-            line_of_connection = utils.cardinalised(
-                line_of_connection, config_eng.symbol.mark_cardinal_alignment_margin
-            )
-            mark.next_to(
-                mobject_or_point=anchor.pos,
-                direction=line_of_connection,
-                buff=mn.SMALL_BUFF,
-            )
 
-        return updater
+@functools.lru_cache(maxsize=256)
+def _get_mathtex_prototype(
+    tex_strings: tuple[str, ...], font_size: float, template_key: _TexTemplateKey
+) -> mn.MathTex:
+    return mn.MathTex(
+        *tex_strings, font_size=font_size, tex_template=template_key.template
+    )
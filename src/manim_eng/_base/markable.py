@@ -6,11 +6,12 @@ mark
 """
 
 import abc
-from typing import Any, Self
+from typing import Any, Mapping, Self
 
 import manim as mn
 
 from manim_eng._base.mark import Mark
+from manim_eng._utils import utils
 
 __all__ = ["Markable"]
 
@@ -40,30 +41,39 @@ class Markable(mn.VMobject, metaclass=abc.ABCMeta):
         return self
 
     def add(self, *mobjects: mn.Mobject) -> Self:
-        for mobject in [*mobjects]:
+        plain = []
+        for mobject in mobjects:
             if isinstance(mobject, Markable):
                 self.__rotate.add(mobject.__rotate)
                 self.__marks.add(mobject.__marks)
             else:
-                self.__rotate.add(*mobjects)
+                plain.append(mobject)
+        if plain:
+            self.__rotate.add(*plain)
         return self
 
     def add_to_back(self, *mobjects: mn.Mobject) -> Self:
-        for mobject in [*mobjects]:
+        plain = []
+        for mobject in mobjects:
             if isinstance(mobject, Markable):
                 self.__rotate.add_to_back(mobject.__rotate)
                 self.__marks.add_to_back(mobject.__marks)
             else:
-                self.__rotate.add_to_back(*mobjects)
+                plain.append(mobject)
+        if plain:
+            self.__rotate.add_to_back(*plain)
         return self
 
     def remove(self, *mobjects: mn.Mobject) -> Self:
-        for mobject in [*mobjects]:
+        plain = []
+        for mobject in mobjects:
             if isinstance(mobject, Markable):
                 self.__rotate.remove(mobject.__rotate)
                 self.__marks.remove(mobject.__marks)
             else:
-                self.__rotate.remove(*mobjects)
+                plain.append(mobject)
+        if plain:
+            self.__rotate.remove(*plain)
         return self
 
     def _set_mark(self, mark_to_set: Mark, mark_text: str) -> None:
@@ -79,25 +89,31 @@ class Markable(mn.VMobject, metaclass=abc.ABCMeta):
 
     @mn.override_animate(_set_mark)
     def __animate_set_mark(
-        self, mark_to_set: Mark, mark_text: str, anim_args: dict[str, Any] | None = None
+        self,
+        mark_to_set: Mark,
+        mark_text: str,
+        anim_args: Mapping[str, Any] | None = None,
     ) -> mn.Animation:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
 
         if mark_to_set not in self.__marks.submobjects:
             self.__marks.add(mark_to_set)
             return mn.Create(mark_to_set.set_text(mark_text))
 
+        if mark_to_set.tex_strings == [mark_text]:
+            # The text is unchanged, so there is nothing to transform. Waiting keeps
+            # the duration of the animation without copying or interpolating the mark
+            return mn.Wait(**anim_args)
+
         mark_to_set.generate_target()
         mark_to_set.target.set_text(mark_text)
         return mn.MoveToTarget(mark_to_set, **anim_args)
 
     @mn.override_animate(_clear_mark)
     def __animate_clear_mark(
-        self, mark_to_clear: Mark, anim_args: dict[str, Any] | None = None
+        self, mark_to_clear: Mark, anim_args: Mapping[str, Any] | None = None
     ) -> mn.Animation:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
         anim = mn.Uncreate(mark_to_clear, remover=False, **anim_args)
         self.__marks.remove(mark_to_clear)
         return anim
@@ -5,10 +5,9 @@ the temporary configuration context manager ``tempconfig_eng``.
 """
 
 import contextlib
-import copy
 from typing import Any, Generator
 
-from .config import ManimEngConfig
+from .config import ConfigBase, ManimEngConfig, _get_loadable_keys
 from .config_readers import get_project_config, get_user_config
 
 __all__ = ["config_eng", "tempconfig_eng"]
@@ -24,13 +23,32 @@ config_eng = (
 @contextlib.contextmanager
 def tempconfig_eng(temp_config: dict[str, Any]) -> Generator:
     global config_eng  # noqa: PLW0602
-    original = copy.deepcopy(config_eng).as_dict()
-
-    config_eng.load_from_dict(temp_config)
+    original = _snapshot(config_eng, temp_config)
 
     try:
+        config_eng.load_from_dict(temp_config)
         yield
     finally:
         # Note that we load here instead of assigning so that we update the original
         # object.
         config_eng.load_from_dict(original)
+
+
+def _snapshot(config: ConfigBase, dictionary: dict[str, Any]) -> dict[str, Any]:
+    """Return the current values of ``config`` for only the keys in ``dictionary``.
+
+    Keys that are not valid for ``config`` are skipped, leaving it to
+    ``load_from_dict()`` to report them.
+    """
+    loadable_keys = _get_loadable_keys(type(config))
+    snapshot: dict[str, Any] = {}
+    for key, value in dictionary.items():
+        if key not in loadable_keys:
+            continue
+        current_value = getattr(config, key)
+        if isinstance(value, dict):
+            if isinstance(current_value, ConfigBase):
+                snapshot[key] = _snapshot(current_value, value)
+            continue
+        snapshot[key] = current_value
+    return snapshot
@@ -1,8 +1,9 @@
 """Configuration classes and parser as well as manim-eng's default configuration."""
 
 import dataclasses as dc
+import functools
+import math
 import re
-from collections import defaultdict
 from typing import Any, Self
 
 import manim as mn
@@ -97,9 +98,35 @@ STRING_TO_MANIM_COLOUR = {
     "logo_black": mn.LOGO_BLACK,
 }
 
+PYTHON_TYPE_NAME_TO_TOML_TYPE = {
+    "str": "string",
+    "int": "integer",
+    "float": "float",
+    "bool": "boolean",
+    "list": "array",
+    "dict": "table",
+    "ManimColor": "string",
+}
+
+
+_EQUILATERAL_SIDE_PER_HEIGHT = 2 / math.sqrt(3)
+"""The ratio of an equilateral triangle's side length to its height."""
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Mark ``array`` as read-only so that it can be safely shared, and return it."""
+    array.flags.writeable = False
+    return array
+
 
 class ConfigBase:
-    """Base class for manim-eng configuration classes."""
+    """Base class for manim-eng configuration classes.
+
+    Subclasses must be dataclasses. Fields whose names begin with an underscore are
+    treated as private, and are neither loadable nor included in ``as_dict()``.
+    """
+
+    __slots__ = ()
 
     def load_from_dict(
         self, dictionary: dict[str, Any], table_prefix: str = ""
@@ -122,18 +149,22 @@ class ConfigBase:
         ``{}`` will do nothing, as it is the equivalent of reading in an empty
         configuration file. The same goes for empty ``dict``s as values for tables: no
         change will be made to the table in this case.
+
         """
-        possible_keys = self.__dict__.keys()
+        if not dictionary:
+            return self
 
+        loadable_keys = _get_loadable_keys(type(self))
         for key, value in dictionary.items():
-            if key not in possible_keys:
+            value_is_table = isinstance(value, dict)
+            if key not in loadable_keys:
                 raise ValueError(
-                    f"Invalid {'table' if isinstance(value, dict) else 'key'} "
+                    f"Invalid {'table' if value_is_table else 'key'} "
                     f"in manim-eng configuration: `{table_prefix}{key}`"
                 )
             current_value = getattr(self, key)
 
-            if isinstance(value, dict):
+            if value_is_table:
                 # In this case, we have encountered a table.
                 # First, check that this is a valid table.
                 if not isinstance(current_value, ConfigBase):
@@ -142,13 +173,9 @@ class ConfigBase:
                         f"`{table_prefix}{key}`"
                     )
                 # If it is, we call `load_from_dict` on the instance of ConfigBase that
-                # represents the table.
-                setattr(
-                    self,
-                    key,
-                    type(current_value).load_from_dict(
-                        current_value, value, table_prefix=f"{table_prefix}{key}."
-                    ),
+                # represents the table, which updates it in place.
+                current_value.load_from_dict(
+                    value, table_prefix=f"{table_prefix}{key}."
                 )
                 continue
 
@@ -198,11 +225,15 @@ class ConfigBase:
             This configuration as a dictionary, with subconfigurations being added as
             subdictionaries.
         """
-        dictionary = self.__dict__
-        for key, value in dictionary.items():
-            if isinstance(value, ConfigBase):
-                dictionary[key] = value.as_dict()
-        return dictionary
+        values = (
+            (field.name, getattr(self, field.name))
+            for field in dc.fields(self)  # type: ignore[arg-type]
+            if not field.name.startswith("_")
+        )
+        return {
+            key: value.as_dict() if isinstance(value, ConfigBase) else value
+            for key, value in values
+        }
 
     @staticmethod
     def _get_toml_type_from_python_variable(variable: Any) -> str:
@@ -215,23 +246,24 @@ class ConfigBase:
 
         This is (roughly) an inversion of the table in the `tomllib docs <https://docs.python.org/3/library/tomllib.html#conversion-table>`_.
         """
-        type_name = type(variable).__name__
-        conversion_table = defaultdict(
-            lambda: "table",
-            {
-                "str": "string",
-                "int": "integer",
-                "float": "float",
-                "bool": "boolean",
-                "list": "array",
-                "dict": "table",
-                "ManimColor": "string",
-            },
-        )
-        return conversion_table[type_name]
+        return PYTHON_TYPE_NAME_TO_TOML_TYPE.get(type(variable).__name__, "table")
+
+
+@functools.cache
+def _get_loadable_keys(config_class: type[ConfigBase]) -> frozenset[str]:
+    """Return the names of the public fields of a configuration class.
 
+    The result is cached per class, as the fields of a dataclass are fixed once it has
+    been defined.
+    """
+    return frozenset(
+        field.name
+        for field in dc.fields(config_class)  # type: ignore[arg-type]
+        if not field.name.startswith("_")
+    )
 
-@dc.dataclass
+
+@dc.dataclass(slots=True)
 class ComponentSymbolConfig(ConfigBase):
     """Component display and behaviour configuration."""
 
@@ -244,7 +276,7 @@ class ComponentSymbolConfig(ConfigBase):
     voltage sources and sensors."""
     component_stroke_width: float = mn.DEFAULT_STROKE_WIDTH
     """The stroke width to use for the component symbols."""
-    current_arrow_radius: float = (2 / np.sqrt(3)) * 0.2 * bipole_height
+    current_arrow_radius: float = _EQUILATERAL_SIDE_PER_HEIGHT * 0.2 * bipole_height
     """The length from the centre of the current arrow triangle from its centre to one
     of its vertices."""
     terminal_length: float = 0.5 * bipole_width
@@ -253,7 +285,7 @@ class ComponentSymbolConfig(ConfigBase):
     """The stroke width to use for wires."""
     mark_font_size: float = 36.0
     """The default font size to use for marks (e.g. labels and annotations)."""
-    mark_cardinal_alignment_margin: float = 5 * (mn.PI / 180)
+    mark_cardinal_alignment_margin: float = 5 * mn.DEGREES
     """The maximum angle a component can be from one of horizontal or vertical whilst
     still being considered horizontal or vertical for the purpose of mark alignment."""
     arrow_stroke_width: float = wire_stroke_width
@@ -273,29 +305,59 @@ class ComponentSymbolConfig(ConfigBase):
     plate_height: float = 5 * plate_gap
     """The height of plates of plated components (i.e. capacitors and cells)."""
 
+    # The terminal positions are derived on access, rather than stored, so that they
+    # can never go stale relative to the sizes they are derived from, however those
+    # are changed
+    @property
+    def _bipole_left_terminal_position(self) -> np.ndarray:
+        return _get_terminal_positions(self.bipole_width)[0]
+
+    @property
+    def _bipole_right_terminal_position(self) -> np.ndarray:
+        return _get_terminal_positions(self.bipole_width)[1]
+
+    @property
+    def _square_bipole_left_terminal_position(self) -> np.ndarray:
+        return _get_terminal_positions(self.square_bipole_side_length)[0]
+
+    @property
+    def _square_bipole_right_terminal_position(self) -> np.ndarray:
+        return _get_terminal_positions(self.square_bipole_side_length)[1]
+
+
+@functools.lru_cache(maxsize=8)
+def _get_terminal_positions(width: float) -> tuple[np.ndarray, np.ndarray]:
+    """Return the left and right terminal positions of a bipole of width ``width``.
+
+    The positions are cached per width, and are read-only so that they can be shared
+    between all the terminals built from them.
+    """
+    half_width = width / 2
+    return _read_only(half_width * mn.LEFT), _read_only(half_width * mn.RIGHT)
+
 
-@dc.dataclass
+@dc.dataclass(slots=True)
 class AnchorDisplayConfig(ConfigBase):
     """Anchor debug display configuration."""
 
-    annotation_colour: mn.ManimColor = dc.field(default_factory=lambda: mn.BLUE)
+    annotation_colour: mn.ManimColor = mn.BLUE
     """The colour to use for annotation anchors' debug visuals."""
-    centre_colour: mn.ManimColor = dc.field(default_factory=lambda: mn.PURPLE)
+    centre_colour: mn.ManimColor = mn.PURPLE
     """The colour to use for centre anchors' debug visuals."""
-    current_colour: mn.ManimColor = dc.field(default_factory=lambda: mn.ORANGE)
+    current_colour: mn.ManimColor = mn.ORANGE
     """The colour to use for current anchors' debug visuals."""
-    label_colour: mn.ManimColor = dc.field(default_factory=lambda: mn.RED)
+    label_colour: mn.ManimColor = mn.RED
     """The colour to use for label anchors' debug visuals."""
     radius: float = 0.06
     """The radius of anchor visualisation rings."""
     stroke_width: float = 2.0
     """The stroke width of anchor visualisation rings."""
-    terminal_colour: mn.ManimColor = dc.field(default_factory=lambda: mn.GREEN)
+    terminal_colour: mn.ManimColor = mn.GREEN
     """The colour to use for terminal anchors' debug visuals."""
-    voltage_colour: mn.ManimColor = dc.field(default_factory=lambda: mn.YELLOW)
+    voltage_colour: mn.ManimColor = mn.YELLOW
 
 
-@dc.dataclass
+@dc.dataclass(slots=True)
 class ManimEngConfig(ConfigBase):
     """manim-eng configuration."""
 
@@ -1,9 +1,11 @@
 """Configuration readers for parsing TOML config files to Python dictionaries."""
 
+import copy
+import functools
 import os
 from typing import Any
 
-import tomllib
+_CONFIG_FILE_NAME = "manim-eng.toml"
 
 
 class UnsupportedOsTypeError(RuntimeError):
@@ -23,7 +25,18 @@ def get_user_config() -> dict[str, Any]:
     dict[str, Any]
         A dictionary representation of the TOML file. If the file cannot be found,
         returns an empty dictionary ``{}``.
+
+    Notes
+    -----
+    The file is only read and parsed once per process. Subsequent calls return a copy
+    of the cached result.
     """
+    return copy.deepcopy(_load_user_config())
+
+
+@functools.lru_cache(maxsize=1)
+def _load_user_config() -> dict[str, Any]:
+    """Read and parse the user-level configuration file (see ``get_user_config()``)."""
     home_directory = os.path.expanduser("~")
     config_directory: str
 
@@ -35,13 +48,7 @@ def get_user_config() -> dict[str, Any]:
         case other:
             raise UnsupportedOsTypeError(f"Unsupported/unknown OS type '{other}'.")
 
-    config_file = config_directory + "/manim-eng.toml"
-
-    try:
-        with open(config_file, "rb") as filehandle:
-            return tomllib.load(filehandle)
-    except OSError:
-        return {}
+    return _read_toml_file(f"{config_directory}/{_CONFIG_FILE_NAME}")
 
 
 def get_project_config() -> dict[str, Any]:
@@ -53,9 +60,25 @@ def get_project_config() -> dict[str, Any]:
         A dictionary representation of the TOML file. If the file cannot be found,
         returns an empty dictionary ``{}``.
     """
-    config_file = os.getcwd() + "/manim-eng.toml"
+    return _read_toml_file(f"{os.getcwd()}/{_CONFIG_FILE_NAME}")
+
+
+def _read_toml_file(path: str) -> dict[str, Any]:
+    """Read the TOML file at ``path`` into memory and parse it.
+
+    Returns an empty dictionary ``{}`` if the file cannot be read.
+    """
+    # Not having a configuration file is the common case, so check for it up front
+    # rather than going through the raising and handling of an exception
+    if not os.path.isfile(path):
+        return {}
     try:
-        with open(config_file, "rb") as filehandle:
-            return tomllib.load(filehandle)
+        with open(path, "rb") as filehandle:
+            contents = filehandle.read()
     except OSError:
         return {}
+    # Imported here so that the parser is only loaded if there is a file to parse,
+    # which for most users there isn't
+    import tomllib
+
+    return tomllib.loads(contents.decode("utf-8"))
@@ -1,9 +1,17 @@
 """Utilities for the rest of manim-eng."""
 
-import manim as mn
+import math
+from types import MappingProxyType
+from typing import Any, Mapping
+
 import numpy as np
 from manim import typing as mnt
 
+EMPTY_ANIM_ARGS: Mapping[str, Any] = MappingProxyType({})
+"""Shared, read-only default for the ``anim_args`` of animation overrides."""
+
+_QUARTER_TURN = math.pi / 2
+
 
 def cardinalised(vector: mnt.Vector3D, margin: float | None = None) -> mnt.Vector3D:
     """If ``vector`` is within ``margin`` of a cardinal direction, snap it to it.
@@ -30,20 +38,45 @@ def cardinalised(vector: mnt.Vector3D, margin: float | None = None) -> mnt.Vecto
     Vector3D
         The resultant vector.
     """
-    vector_magnitude = np.linalg.norm(vector)
-    angle = mn.angle_of_vector(vector)
-
-    vector_within_margin_of_cardinal_direction = (
-        (angle + margin) % (np.pi / 2) <= 2 * margin if margin is not None else True
-    )
-    if vector_within_margin_of_cardinal_direction:
-        abs_max_index = np.argmax(np.abs(vector))
-        cardinalised_vector = np.zeros_like(vector)
+    # This is called for every wire and mark on every update, so it works on the
+    # components as scalars rather than paying NumPy's overhead for tiny arrays
+    x, y, z = float(vector[0]), float(vector[1]), float(vector[2])
+
+    if margin is not None and (math.atan2(y, x) + margin) % _QUARTER_TURN > 2 * margin:
+        return vector
+
+    absolute_components = (abs(x), abs(y), abs(z))
+    # ``max()`` returns the first of several equal maxima, giving the horizontal
+    # preference in the event of a tie
+    abs_max_index = max(range(3), key=absolute_components.__getitem__)
+    cardinalised_vector = np.zeros(3)
+    if absolute_components[abs_max_index] != 0:
         # Flip the direction of the vector if necessary (i.e. if it's pointing left or
         # down)
-        cardinalised_vector[abs_max_index] = vector_magnitude * np.sign(
-            vector[abs_max_index]
+        cardinalised_vector[abs_max_index] = math.copysign(
+            math.sqrt(x * x + y * y + z * z), (x, y, z)[abs_max_index]
         )
-        return cardinalised_vector
+    return cardinalised_vector
+
+
+def normalised(vector: mnt.Vector3D) -> mnt.Vector3D:
+    """Return ``vector`` scaled to unit length.
+
+    This is equivalent to ``manim.normalize()`` for 3D vectors, but avoids the overhead
+    of ``numpy.linalg.norm()``, which dominates for vectors this small.
 
-    return vector
+    Parameters
+    ----------
+    vector : mnt.Vector3D
+        The vector to normalise. It is not modified.
+
+    Returns
+    -------
+    Vector3D
+        The normalised vector, or the zero vector if ``vector`` has zero length.
+    """
+    x, y, z = float(vector[0]), float(vector[1]), float(vector[2])
+    magnitude = math.sqrt(x * x + y * y + z * z)
+    if magnitude == 0:
+        return np.zeros(3)
+    return np.array([x / magnitude, y / magnitude, z / magnitude])
@@ -3,6 +3,7 @@
 import abc
 
 import manim as mn
+import numpy as np
 from manim import typing as mnt
 
 from manim_eng import config_eng
@@ -10,6 +11,9 @@ from manim_eng.components.base import Terminal
 
 __all__ = ["WireBase"]
 
+# How far the wire extends past each terminal end, back into the terminal
+_TERMINAL_OVERLAP = 0.001
+
 
 class WireBase(mn.VMobject, metaclass=abc.ABCMeta):
     """Base class for wire objects.
@@ -30,23 +34,65 @@ class WireBase(mn.VMobject, metaclass=abc.ABCMeta):
         self.from_terminal = from_terminal
         self.to_terminal = to_terminal
 
+        self.__points_buffer: mnt.Point3D_Array = np.empty((0, 3))
+        self.__shape_key: tuple | None = None
+        self.__constructed_points: mnt.Point3D_Array | None = None
         self.__construct_wire()
 
         if updating:
-            self.add_updater(lambda mob: mob.__construct_wire())
+            # The plain function is registered (rather than a bound method) so that
+            # copies of the wire update themselves, not the original
+            self.add_updater(WireBase.__construct_wire)
 
     def __construct_wire(self) -> None:
-        # The extra points involving the 0.001 factors extend the wire ever so slightly
-        # into the terminals, producing a nice clean join between the terminals and the
-        # wire
-        self.set_points_as_corners(
-            [
-                self.from_terminal.end - 0.001 * self.from_terminal.direction,
-                self.from_terminal.end,
-                *self.get_corner_points(),
-                self.to_terminal.end,
-                self.to_terminal.end - 0.001 * self.to_terminal.direction,
-            ]
+        # Skip reconstruction if nothing the shape depends on has changed. The points
+        # are compared with a copy taken at construction, which catches the wire
+        # itself having been moved since, including by transforms that modify the
+        # points in place
+        shape_key = self._get_shape_key()
+        if shape_key == self.__shape_key and np.array_equal(
+            self.points, self.__constructed_points
+        ):
+            return
+
+        corner_points = self.get_corner_points()
+        number_of_points = len(corner_points) + 4
+        # Reuse the same buffer between updates, only growing it when the number of
+        # corners does
+        if len(self.__points_buffer) < number_of_points:
+            self.__points_buffer = np.empty((number_of_points, 3))
+        points = self.__points_buffer[:number_of_points]
+        # The first and last points extend the wire ever so slightly into the
+        # terminals, producing a nice clean join between the terminals and the wire.
+        # They are written straight into the buffer to avoid temporary arrays
+        points[1] = self.from_terminal.end
+        np.multiply(self.from_terminal.direction, -_TERMINAL_OVERLAP, out=points[0])
+        points[0] += points[1]
+        # Assigned row by row, as slice assignment from a list of arrays would first
+        # stack them into a temporary array
+        for index, corner_point in enumerate(corner_points, start=2):
+            points[index] = corner_point
+        points[-2] = self.to_terminal.end
+        np.multiply(self.to_terminal.direction, -_TERMINAL_OVERLAP, out=points[-1])
+        points[-1] += points[-2]
+        self.set_points_as_corners(points)
+
+        self.__shape_key = shape_key
+        self.__constructed_points = self.points.copy()
+
+    def _get_shape_key(self) -> tuple:
+        """Return a key that changes whenever the shape of the wire would.
+
+        Subclasses whose corner points depend on anything other than the position and
+        direction of the two terminals must extend this.
+        """
+        # The terminals themselves are part of the key, as the version counters of
+        # two different terminals can coincide
+        return (
+            self.from_terminal,
+            self.from_terminal._refresh_version(),
+            self.to_terminal,
+            self.to_terminal._refresh_version(),
         )
 
     @abc.abstractmethod
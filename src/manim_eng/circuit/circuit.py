@@ -1,11 +1,12 @@
 """Contains the Circuit class."""
 
-from typing import Any, Callable, Self, Sequence, cast
+from typing import Any, Collection, Mapping, Self, Sequence, cast
 
 import manim as mn
 
 __all__ = ["Circuit"]
 
+from manim_eng._utils import utils
 from manim_eng.circuit.wire import Wire
 from manim_eng.components.base.component import Component
 from manim_eng.components.base.terminal import Terminal
@@ -27,6 +28,11 @@ class Circuit(mn.VMobject):
         self.wires = mn.VGroup()
         super().add(self.components, self.wires)
 
+        # Maps each terminal in the circuit to the component it belongs to. Kept up to
+        # date by ``add()`` and ``remove()``, so that terminal ownership checks don't
+        # need to gather the terminals of every component each time
+        self.__terminal_owners: dict[Terminal, Component] = {}
+
         self.add(*components)
 
     def add(self, *components: Component) -> Self:
@@ -37,10 +43,14 @@ class Circuit(mn.VMobject):
         *components : Component
             The component(s) to add.
         """
+        # Add all the components in one go, as each call to ``add()`` rebuilds the
+        # submobject list
+        self.components.add(*components)
         for component in components:
             # Update here to make sure that all marks are properly aligned
             component.update()
-            self.components.add(component)
+            for terminal in component.terminals:
+                self.__terminal_owners[terminal] = component
         return self
 
     def remove(self, *components: Component) -> Self:
@@ -52,6 +62,11 @@ class Circuit(mn.VMobject):
             The component(s) to remove.
         """
         self.components.remove(*components)
+        for component in components:
+            for terminal in component.terminals:
+                # Only forget terminals of components that were actually in the circuit
+                if self.__terminal_owners.get(terminal) is component:
+                    del self.__terminal_owners[terminal]
         return self
 
     def connect(self, from_terminal: Terminal, to_terminal: Terminal) -> Self:
@@ -71,8 +86,9 @@ class Circuit(mn.VMobject):
         ValueError
             If either terminal doesn't belong to a component in this circuit.
         """
+        self.__check_terminals_are_different(from_terminal, to_terminal)
         self.__check_terminals_all_belong_to_this_circuit([from_terminal, to_terminal])
-        self.wires.add(Wire(from_terminal, to_terminal))
+        self.__add_wire(Wire(from_terminal, to_terminal))
         return self
 
     def disconnect(self, *components_or_terminals: Component | Terminal) -> Self:
@@ -96,14 +112,8 @@ class Circuit(mn.VMobject):
         --------
         isolate : Remove a wire if either of its ends is specified.
         """
-        terminals = self._collapse_components_and_terminals_to_terminals(
-            components_or_terminals
-        )
-        self.__check_terminals_all_belong_to_this_circuit(terminals)
-        to_remove = self.__get_wires_from_terminal_condition(
-            terminals, lambda start, end: start and end
-        )
-        self.wires.remove(*to_remove)
+        to_remove = self.__filter_wires(components_or_terminals, require_both_ends=True)
+        self.__remove_wires(to_remove)
         return self
 
     def isolate(self, *components_or_terminals: Component | Terminal) -> Self:
@@ -126,71 +136,97 @@ class Circuit(mn.VMobject):
         --------
         disconnect : Remove a wire if both its ends are specified.
         """
-        terminals = self._collapse_components_and_terminals_to_terminals(
-            components_or_terminals
-        )
-        self.__check_terminals_all_belong_to_this_circuit(terminals)
-        to_remove = self.__get_wires_from_terminal_condition(
-            terminals, lambda start, end: start or end
+        to_remove = self.__filter_wires(
+            components_or_terminals, require_both_ends=False
         )
-        self.wires.remove(*to_remove)
+        self.__remove_wires(to_remove)
         return self
 
     @staticmethod
     def _collapse_components_and_terminals_to_terminals(
         components_or_terminals: Sequence[Component | Terminal],
-    ) -> list[Terminal]:
-        terminals = []
-        for component_or_terminal in components_or_terminals:
-            if isinstance(component_or_terminal, Component):
-                terminals.extend(component_or_terminal.terminals)
-            else:
-                terminals.append(component_or_terminal)
-        # Remove duplicate entries
-        return list(set(terminals))
-
-    def __get_wires_from_terminal_condition(
-        self, terminals: Sequence[Terminal], condition: Callable[[bool, bool], bool]
-    ) -> list[Wire]:
-        """Return a list of wires from the circuit based on a given condition.
+    ) -> set[Terminal]:
+        # Collected straight into a set, which removes duplicate entries and gives
+        # constant-time membership checks for the wire searches
+        return {
+            terminal
+            for component_or_terminal in components_or_terminals
+            for terminal in (
+                component_or_terminal.terminals
+                if isinstance(component_or_terminal, Component)
+                else (component_or_terminal,)
+            )
+        }
 
-        Iterates through all connections and calculates if each end of the wire is in
-        ``terminals``. Whether each one is in ``terminals`` is passed to ``condition``,
-        which is expected
+    def __add_wire(self, wire: Wire) -> None:
+        self.wires.add(wire)
+
+    def __remove_wires(self, wires: Sequence[Wire]) -> None:
+        if len(wires) == 0:
+            return
+        self.wires.remove(*wires)
+
+    def __filter_wires(
+        self,
+        components_or_terminals: Sequence[Component | Terminal],
+        require_both_ends: bool,
+    ) -> list[Wire]:
+        """Return the wires attached to the given components and/or terminals.
 
         Parameters
         ----------
-        terminals : Sequence[Terminal]
-            The terminals to check all wires for.
-        condition : Callable[[bool, bool], bool]
-            The condition to use to determine whether a wire should be returned. Will be
-            passed two booleans, whether the start or end of the wire is in
-            ``terminals``, respectively, and should return ``True`` if the wire should
-            be returned and ``False`` otherwise.
+        components_or_terminals : Sequence[Component | Terminal]
+            The components and terminals to find the wires of.
+        require_both_ends : bool
+            Whether to only return wires that *both* start *and* end at one of
+            ``components_or_terminals``, rather than those that *either* start *or* end
+            at one of them.
 
         Returns
         -------
         list[Wire]
-            The list of wires selected by the condition.
+            The selected wires.
+
+        Raises
+        ------
+        ValueError
+            If any passed terminal does not belong to a component in this circuit.
         """
-        to_remove = []
-        for wire in cast(list[Wire], self.wires.submobjects):
-            if condition(
-                wire.from_terminal in terminals,
-                wire.to_terminal in terminals,
-            ):
-                to_remove.append(wire)
-        return to_remove
+        terminals = self._collapse_components_and_terminals_to_terminals(
+            components_or_terminals
+        )
+        self.__check_terminals_all_belong_to_this_circuit(terminals)
 
-    def __check_terminals_all_belong_to_this_circuit(
-        self, terminals: list[Terminal]
+        # ``wires`` is public, so it is searched directly rather than through an index
+        # that wires added or removed by the user would bypass
+        wires = cast(list[Wire], self.wires.submobjects)
+        if require_both_ends:
+            return [
+                wire
+                for wire in wires
+                if wire.from_terminal in terminals and wire.to_terminal in terminals
+            ]
+        return [
+            wire
+            for wire in wires
+            if wire.from_terminal in terminals or wire.to_terminal in terminals
+        ]
+
+    @staticmethod
+    def __check_terminals_are_different(
+        from_terminal: Terminal, to_terminal: Terminal
     ) -> None:
-        terminal_set = set(terminals)
-        owned_terminal_set = set()
-        for component in self.components.submobjects:
-            owned_terminal_set.update(component.terminals)
+        # Checked first, as it is much cheaper than checking terminal ownership
+        if from_terminal is to_terminal:
+            raise ValueError(
+                "`from_terminal` and `to_terminal` are identical. "
+                "`connect()` requires two different terminals."
+            )
 
-        terminals_not_owned = terminal_set.difference(owned_terminal_set)
+    def __check_terminals_all_belong_to_this_circuit(
+        self, terminals: Collection[Terminal]
+    ) -> None:
+        terminals_not_owned = set(terminals).difference(self.__terminal_owners)
         if len(terminals_not_owned) != 0:
             raise ValueError(
                 f"At least one passed terminal does not "
@@ -204,59 +240,44 @@ class Circuit(mn.VMobject):
         self,
         from_terminal: Terminal,
         to_terminal: Terminal,
-        anim_args: dict[str, Any] | None = None,
+        anim_args: Mapping[str, Any] | None = None,
     ) -> mn.Animation:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
 
+        self.__check_terminals_are_different(from_terminal, to_terminal)
         self.__check_terminals_all_belong_to_this_circuit([from_terminal, to_terminal])
-        if from_terminal == to_terminal:
-            raise ValueError(
-                "`from_terminal` and `to_terminal` are identical. "
-                "`connect()` requires two different terminals."
-            )
         new_wire = Wire(from_terminal, to_terminal)
-        self.wires.add(new_wire)
+        self.__add_wire(new_wire)
         return mn.Create(new_wire, **anim_args)
 
     @mn.override_animate(disconnect)
     def __animate_disconnect(
         self,
         *components_or_terminals: Component | Terminal,
-        anim_args: dict[str, Any] | None = None,
+        anim_args: Mapping[str, Any] | None = None,
     ) -> mn.Animation:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
 
-        terminals = self._collapse_components_and_terminals_to_terminals(
-            components_or_terminals
-        )
-        self.__check_terminals_all_belong_to_this_circuit(terminals)
-        to_remove = self.__get_wires_from_terminal_condition(
-            terminals, lambda start, end: start and end
-        )
-        animations = [mn.Uncreate(wire, **anim_args) for wire in to_remove]
-        self.wires.remove(*to_remove)
+        to_remove = self.__filter_wires(components_or_terminals, require_both_ends=True)
+        self.__remove_wires(to_remove)
 
-        return mn.AnimationGroup(*animations)
+        return mn.AnimationGroup(
+            *(mn.Uncreate(wire, **anim_args) for wire in to_remove)
+        )
 
     @mn.override_animate(isolate)
     def __animate_isolate(
         self,
         *components_or_terminals: Component | Terminal,
-        anim_args: dict[str, Any] | None = None,
+        anim_args: Mapping[str, Any] | None = None,
     ) -> mn.Animation:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
 
-        terminals = self._collapse_components_and_terminals_to_terminals(
-            components_or_terminals
+        to_remove = self.__filter_wires(
+            components_or_terminals, require_both_ends=False
         )
-        self.__check_terminals_all_belong_to_this_circuit(terminals)
-        to_remove = self.__get_wires_from_terminal_condition(
-            terminals, lambda start, end: start or end
-        )
-        animations = [mn.Uncreate(wire, **anim_args) for wire in to_remove]
-        self.wires.remove(*to_remove)
+        self.__remove_wires(to_remove)
 
-        return mn.AnimationGroup(*animations)
+        return mn.AnimationGroup(
+            *(mn.Uncreate(wire, **anim_args) for wire in to_remove)
+        )
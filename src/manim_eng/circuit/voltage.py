@@ -1,6 +1,7 @@
 """Contains Voltage class for drawing voltages between component terminals."""
 
-from typing import Any, Self, cast
+import math
+from typing import Any, Mapping, Self
 
 import manim as mn
 import manim.typing as mnt
@@ -10,6 +11,7 @@ from manim_eng import config_eng
 from manim_eng._base.anchor import CentreAnchor, VoltageAnchor
 from manim_eng._base.mark import Mark
 from manim_eng._base.markable import Markable
+from manim_eng._utils import utils
 from manim_eng.components.base.terminal import Terminal
 
 __all__ = ["Voltage"]
@@ -61,14 +63,21 @@ class Voltage(Markable):
         self.component_to_avoid = avoid
         self.component_buff = component_buff
 
-        self._direction = to_terminal.end - from_terminal.end
-        self._angle_of_direction = mn.angle_of_vector(self._direction)
+        # Both set by the arrow updater, and only recomputed when it rebuilds the arrow
+        self._direction: mnt.Vector3D
+        self._angle_of_direction: float
 
         self._arrow: mn.Arrow = mn.Arrow(mn.ORIGIN, mn.ORIGIN)
         self._centre_reference = CentreAnchor()
         self._anchor = VoltageAnchor()
 
-        self.add_updater(lambda mob: mob.__arrow_updater())
+        self.__arrow_key: tuple | None = None
+        self.__rotation: tuple[float, float]
+        self.__arrow_points: mnt.Point3D_Array | None = None
+        self.__avoided_points: mnt.Point3D_Array | None = None
+        # The plain function is registered (rather than a bound method) so that copies
+        # of the voltage update themselves, not the original
+        self.add_updater(Voltage.__arrow_updater)
         self.update()
 
         self.add(self._arrow, self._centre_reference, self._anchor)
@@ -202,18 +211,64 @@ class Voltage(Markable):
         return self
 
     def __arrow_updater(self) -> None:
+        # Rebuilding the arrow is expensive, so skip it if nothing it depends on has
+        # changed. The points of the arrow and of the avoided mobject are compared
+        # with copies taken when the arrow was built, which catches either having been
+        # changed in place (e.g. a switch's wiper being rotated)
+        arrow_key = self.__get_arrow_key()
+        avoided_points = (
+            self.component_to_avoid.get_points_defining_boundary()
+            if self.component_to_avoid is not None
+            else None
+        )
+        if (
+            arrow_key == self.__arrow_key
+            and np.array_equal(self._arrow.points, self.__arrow_points)
+            and (
+                avoided_points is None
+                or np.array_equal(avoided_points, self.__avoided_points)
+            )
+        ):
+            return
+
         self._direction = self.to_terminal.end - self.from_terminal.end
-        self._angle_of_direction = mn.angle_of_vector(self._direction)
+        self._angle_of_direction = math.atan2(self._direction[1], self._direction[0])
+        # Both critical points are found with the arrow's direction rotated to the
+        # horizontal, so the rotation is worked out once for the two of them
+        self.__rotation = (
+            math.cos(-self._angle_of_direction),
+            math.sin(-self._angle_of_direction),
+        )
 
         self.__update_arrow()
         self.__update_anchors()
 
+        self.__arrow_key = arrow_key
+        self.__arrow_points = self._arrow.points.copy()
+        self.__avoided_points = avoided_points
+
+    def __get_arrow_key(self) -> tuple:
+        """Return a key that changes whenever the shape of the arrow would."""
+        return (
+            self.from_terminal,
+            self.from_terminal._refresh_version(),
+            self.to_terminal,
+            self.to_terminal._refresh_version(),
+            self.clockwise,
+            self.buff,
+            self.component_buff,
+            self.component_to_avoid,
+            config_eng.symbol.voltage_default_angle,
+            config_eng.symbol.arrow_stroke_width,
+            config_eng.symbol.arrow_tip_length,
+        )
+
     def __update_arrow(self) -> None:
         if self.component_to_avoid is not None:
             middle_point = self._get_critical_point_at_different_rotation(
                 self.component_to_avoid,
                 mn.UP if self.clockwise else mn.DOWN,
-                -self._angle_of_direction,
+                *self.__rotation,
             )
             middle_point = self._introduce_buffer_to_point(
                 middle_point, self.component_to_avoid.get_center(), self.component_buff
@@ -237,7 +292,7 @@ class Voltage(Markable):
 
     def __update_anchors(self) -> None:
         top_of_arrow_bow = self._get_critical_point_at_different_rotation(
-            self._arrow, mn.UP if self.clockwise else mn.DOWN, -self._angle_of_direction
+            self._arrow, mn.UP if self.clockwise else mn.DOWN, *self.__rotation
         )
 
         self._centre_reference.move_to(self._arrow.get_center())
@@ -245,13 +300,13 @@ class Voltage(Markable):
 
     @staticmethod
     def _get_critical_point_at_different_rotation(
-        mobject: mn.VMobject, direction: mnt.Vector3D, rotation: float
+        mobject: mn.VMobject, direction: mnt.Vector3D, cos: float, sin: float
     ) -> mnt.Point3D:
         """Get a critical point on a mobject at a different rotation.
 
         Get, in global coordinates, the position a critical point given by
-        ``direction`` would be on ``mobject`` if the component were rotated by
-        ``rotation``. The passed mobject will be unaffected by this call.
+        ``direction`` would be on ``mobject`` if the component were rotated about its
+        centre. The passed mobject will be unaffected by this call.
 
         Parameters
         ----------
@@ -259,22 +314,44 @@ class Voltage(Markable):
             The mobject to get a point on.
         direction : Vector3D
             The direction to use to find the critical point.
-        rotation : float
-            The amount to rotate the component before finding the critical point.
+        cos, sin : float
+            The cosine and sine of the angle to rotate the component by before finding
+            the critical point.
 
         Returns
         -------
         Point3D
             The coordinates of the point in global, unrotated coordinate space.
         """
-        reference = mn.VMobject()
-        reference.points = mobject.get_all_points()
+        # Use the same boundary points as ``Mobject.get_critical_point()`` would
+        points = mobject.get_points_defining_boundary()
+        if len(points) == 0:
+            return np.zeros(3)
+        centre = mobject.get_center()
+
+        # Rotate the points about the centre in 2D, rather than rotating a copy of the
+        # whole mobject, as rotation about the z-axis leaves the z-ordinates unchanged
+        relative = points - centre
+        rotated = (
+            relative[:, 0] * cos - relative[:, 1] * sin,
+            relative[:, 0] * sin + relative[:, 1] * cos,
+            relative[:, 2],
+        )
 
-        rotated_reference_critical_point = reference.rotate(
-            rotation, about_point=mobject.get_center()
-        ).get_critical_point(direction)
-        relative_to_centre = rotated_reference_critical_point - mobject.get_center()
-        return mobject.get_center() + mn.rotate_vector(relative_to_centre, -rotation)
+        # The critical point of the rotated points' bounding box, relative to the centre
+        critical = [
+            _get_extremum(ordinates, direction_ordinate)
+            for ordinates, direction_ordinate in zip(rotated, direction)
+        ]
+
+        # Rotate the critical point back to the unrotated coordinate space
+        return centre + np.array(
+            [
+                critical[0] * cos + critical[1] * sin,
+                -critical[0] * sin + critical[1] * cos,
+                critical[2],
+            ]
+        )
 
     def _introduce_buffer_to_point(
         self, middle_point: mnt.Point3D, relative_to: mnt.Point3D, buff: float
@@ -299,9 +376,11 @@ class Voltage(Markable):
             The new point.
         """
         relative_to_reference = middle_point - relative_to
-        direction = mn.normalize(relative_to_reference)
-        length = np.linalg.norm(relative_to_reference)
-        return relative_to + direction * (length + buff)
+        length = math.sqrt(relative_to_reference @ relative_to_reference)
+        if length == 0:
+            # There is no direction to move in
+            return np.array(relative_to)
+        return relative_to + relative_to_reference * ((length + buff) / length)
 
     def _get_arc_details_for_middle_point(self, middle_point: mnt.Point3D) -> float:
         """Calculate the voltage arrow's arc to pass through ``middle_point``.
@@ -336,41 +415,48 @@ class Voltage(Markable):
         bisectors of the lines :math:`AB` and :math:`BC`. These can be found fairly
         easily by calculating the midpoint and the perpendicular vector.
 
-        The intersection is then found using linear algebra, by forming simultaneous
-        equations from the vector equations of the bisectors and solving for the scaling
-        factors.
+        The intersection is then found by forming simultaneous equations from the vector
+        equations of the bisectors and solving for the scaling factors with Cramer's
+        rule. If the three points are collinear the bisectors are parallel, and the arc
+        degenerates to a straight line, so an angle of zero is returned.
         """
-        chord_ab = middle_point - self.from_terminal.end
-        chord_bc = self.to_terminal.end - middle_point
-
-        mid_ab = self.from_terminal.end + chord_ab / 2
-        mid_bc = middle_point + chord_bc / 2
-
-        perp_ab = np.cross(chord_ab, mn.OUT)
-        perp_bc = np.cross(chord_bc, mn.OUT)
-
-        # Solve for the intersection of the perpendicular bisectors using matrices
-        matrix = np.array([[perp_ab[0], -perp_bc[0]], [perp_ab[1], -perp_bc[1]]])
-        y = (mid_bc - mid_ab)[:2]
-        x = np.linalg.inv(matrix) @ y
+        # Worked through in scalars, as every quantity is a 2D vector and NumPy's
+        # per-operation overhead would dwarf the arithmetic
+        a_x, a_y = float(self.from_terminal.end[0]), float(self.from_terminal.end[1])
+        b_x, b_y = float(middle_point[0]), float(middle_point[1])
+        c_x, c_y = float(self.to_terminal.end[0]), float(self.to_terminal.end[1])
+
+        # The perpendicular bisectors pass through the midpoints of the chords, in the
+        # direction of the chords crossed with OUT, i.e. (y, -x)
+        mid_ab_x, mid_ab_y = (a_x + b_x) / 2, (a_y + b_y) / 2
+        mid_bc_x, mid_bc_y = (b_x + c_x) / 2, (b_y + c_y) / 2
+        perp_ab_x, perp_ab_y = b_y - a_y, a_x - b_x
+        perp_bc_x, perp_bc_y = c_y - b_y, b_x - c_x
+
+        # Solve [perp_ab, -perp_bc] @ [alpha, beta] = mid_bc - mid_ab for alpha
+        determinant = perp_bc_x * perp_ab_y - perp_ab_x * perp_bc_y
+        if determinant == 0:
+            return 0.0
+        offset_x, offset_y = mid_bc_x - mid_ab_x, mid_bc_y - mid_ab_y
+        alpha = (perp_bc_x * offset_y - offset_x * perp_bc_y) / determinant
 
         # Find the centre using the vector equation for AB's bisector now that we know
-        # the right value of 'alpha' (x[0])
-        centre = mid_ab + x[0] * perp_ab
-
-        radius = np.linalg.norm(centre - middle_point)
-        length = np.linalg.norm(self._direction)
-        return 2 * cast(float, np.arcsin(length / (2 * radius)))
+        # the right value of alpha, and from it the radius
+        centre_x = mid_ab_x + alpha * perp_ab_x
+        centre_y = mid_ab_y + alpha * perp_ab_y
+        radius = math.hypot(centre_x - b_x, centre_y - b_y)
+        length = math.hypot(c_x - a_x, c_y - a_y)
+        # Clamped, as rounding can push the ratio just past 1 for near-semicircles
+        return 2 * math.asin(min(length / (2 * radius), 1.0))
 
     @mn.override_animate(set_label)
     def __animate_set_label(
         self,
         label: str,
         clockwise: bool | None = None,
-        anim_args: dict[str, Any] | None = None,
+        anim_args: Mapping[str, Any] | None = None,
     ) -> mn.Animation:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
 
         label_animation = (
             self.animate(**anim_args)._set_mark(self._label, label).build()
@@ -390,12 +476,25 @@ class Voltage(Markable):
         self,
         label: str,
         clockwise: bool = False,
-        anim_args: dict[str, Any] | None = None,
+        anim_args: Mapping[str, Any] | None = None,
     ) -> mn.Animation:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
         return (
             self.animate(**anim_args)
             .set_label(label=label, clockwise=clockwise)
             .build()
         )
+
+
+def _get_extremum(ordinates: np.ndarray, direction_ordinate: float) -> float:
+    """Return the extremum of ``ordinates`` in the direction given.
+
+    As for ``Mobject.get_critical_point()``, this is the maximum for a positive
+    direction, the minimum for a negative one, and the midpoint between the two for
+    zero.
+    """
+    if direction_ordinate > 0:
+        return float(ordinates.max())
+    if direction_ordinate < 0:
+        return float(ordinates.min())
+    return float(ordinates.min() + ordinates.max()) / 2
@@ -1,6 +1,6 @@
 """Wire and related implementation classes."""
 
-from typing import Sequence, cast
+from typing import Sequence
 
 import manim as mn
 import manim.typing as mnt
@@ -12,6 +12,8 @@ from manim_eng.components.base.terminal import Terminal
 
 __all__ = ["ManualWire", "Wire"]
 
+_PERPENDICULAR_TOLERANCE = 1e-8
+
 
 class ManualWire(WireBase):
     """Wire that requires its path to be manually specified.
@@ -58,6 +60,13 @@ class ManualWire(WireBase):
         """
         return self.corner_points
 
+    def _get_shape_key(self) -> tuple:
+        # The corner points can be changed externally, e.g. by another updater
+        return (
+            *super()._get_shape_key(),
+            np.asarray(self.corner_points, dtype=float).tobytes(),
+        )
+
 
 class Wire(WireBase):
     """Wire to automatically connect components together.
@@ -88,10 +97,12 @@ class Wire(WireBase):
         Returns the vertices of the wire, not including the end points (i.e. at the
         start and end terminals).
         """
-        from_direction = utils.cardinalised(self.from_terminal.direction)
-        to_direction = utils.cardinalised(self.to_terminal.direction)
+        from_direction = self.from_terminal.cardinal_direction
+        to_direction = self.to_terminal.cardinal_direction
 
-        if np.isclose(np.dot(from_direction, to_direction), 0):
+        # Equivalent to ``np.isclose(..., 0)`` with its default absolute tolerance,
+        # without the overhead of its array machinery for a single scalar
+        if abs(np.dot(from_direction, to_direction)) <= _PERPENDICULAR_TOLERANCE:
             return self.__get_corner_points_for_perpendicular_terminals(
                 from_direction, to_direction
             )
@@ -105,27 +116,34 @@ class Wire(WireBase):
         from_end = self.from_terminal.end
         to_end = self.to_terminal.end
 
-        corner_point = mn.find_intersection(
-            [from_end], [from_direction], [to_end], [to_direction]
-        )[0]
+        # The directions are exactly cardinal, so the lines out of the two terminals
+        # meet at the vertex of the box formed from their ends that lies in line with
+        # both, with no need for a general line intersection
+        from_is_horizontal = from_direction[0] != 0
+        if from_is_horizontal:
+            corner_point = np.array([to_end[0], from_end[1], from_end[2]])
+        else:
+            corner_point = np.array([from_end[0], to_end[1], from_end[2]])
 
         if self.__point_is_behind_plane(
             corner_point, from_end, from_direction
         ) or self.__point_is_behind_plane(corner_point, to_end, to_direction):
-            # Move the corner point to the other vertex of the box formed from the end
-            # of each terminal, as two 90 degree turns at a component is better than one
-            # 0 degree and one 180 degree.
-            if corner_point[0] == from_end[0]:
-                corner_point = np.array([to_end[0], from_end[1], 0])
+            # Move the corner point to the other vertex of the box, as two 90 degree
+            # turns at a component is better than one 0 degree and one 180 degree
+            if from_is_horizontal:
+                corner_point[0], corner_point[1] = from_end[0], to_end[1]
             else:
-                corner_point = np.array([from_end[0], to_end[1], 0])
+                corner_point[0], corner_point[1] = to_end[0], from_end[1]
+            corner_point[2] = 0
 
         return [corner_point]
 
     def __get_corner_points_for_parallel_terminals(
         self, from_direction: mnt.Vector3D, to_direction: mnt.Vector3D
     ) -> list[mnt.Point3D]:
-        midpoint = mn.midpoint(self.from_terminal.end, self.to_terminal.end)
+        # ``mn.midpoint()`` goes through ``np.average()`` on a stacked copy of the two
+        # points, which is far more work than the arithmetic itself
+        midpoint = 0.5 * (self.from_terminal.end + self.to_terminal.end)
 
         to_behind_from = self.__point_is_behind_plane(
             self.to_terminal.end, self.from_terminal.end, from_direction
@@ -136,9 +154,10 @@ class Wire(WireBase):
 
         if to_behind_from and from_behind_to:
             # This is necessary to prevent the line from going backwards through the
-            # components
-            from_direction = mn.rotate_vector(from_direction, np.pi / 2)
-            to_direction = mn.rotate_vector(to_direction, np.pi / 2)
+            # components. Rotating a vector in the plane by a quarter turn is just
+            # (x, y) -> (-y, x), which avoids building a rotation matrix
+            from_direction = np.array([-from_direction[1], from_direction[0], 0.0])
+            to_direction = np.array([-to_direction[1], to_direction[0], 0.0])
         # These two are to handle the case where two terminals point in the same
         # direction, so we really want an elbow rather than an 'S'
         elif to_behind_from:
@@ -150,12 +169,13 @@ class Wire(WireBase):
                 midpoint, self.to_terminal.end, to_direction
             )
 
-        perpendicular_direction = np.cross(from_direction, mn.OUT)
-        corner_points = mn.find_intersection(
-            [midpoint] * 2,
-            [perpendicular_direction] * 2,
-            [self.from_terminal.end, self.to_terminal.end],
-            [from_direction, to_direction],
+        # Equivalent to ``np.cross(from_direction, mn.OUT)``
+        perpendicular_direction = np.array([from_direction[1], -from_direction[0], 0.0])
+        corner_points = _find_intersections(
+            midpoint,
+            perpendicular_direction,
+            np.array([self.from_terminal.end, self.to_terminal.end]),
+            np.array([from_direction, to_direction]),
         )
         return list(corner_points)
 
@@ -179,8 +199,7 @@ class Wire(WireBase):
         bool
             ``True`` if the point is behind the plane, ``False`` if it is not.
         """
-        vector_to_point = point - point_on_plane
-        return cast(bool, np.dot(normal, vector_to_point) < 0)
+        return _get_signed_distance_to_plane(point, point_on_plane, normal) < 0
 
     @staticmethod
     def __move_point_forward_of_plane(
@@ -202,9 +221,59 @@ class Wire(WireBase):
         Point3D
             The new plane.
         """
-        vector_to_point = point - point_on_plane
-        distance_to_move = -np.dot(normal, vector_to_point)
+        distance_to_move = -_get_signed_distance_to_plane(point, point_on_plane, normal)
         if distance_to_move <= 0:
             # No movement is necessary
             return point
-        return point + mn.normalize(normal) * distance_to_move
+        return point + utils.normalised(normal) * distance_to_move
+
+
+def _get_signed_distance_to_plane(
+    point: mnt.Point3D, point_on_plane: mnt.Point3D, normal: mnt.Vector3D
+) -> float:
+    """Return the dot product of a plane's normal with the vector from it to a point.
+
+    This is the signed distance of the point from the plane if ``normal`` is of unit
+    length. It is written out component by component because, for a single
+    three-element vector, this is quicker than a subtraction and ``np.dot()``, and
+    allocates no temporary array.
+    """
+    return float(
+        normal[0] * (point[0] - point_on_plane[0])
+        + normal[1] * (point[1] - point_on_plane[1])
+        + normal[2] * (point[2] - point_on_plane[2])
+    )
+
+
+def _find_intersections(
+    p0s: mnt.Point3D | mnt.Point3D_Array,
+    v0s: mnt.Vector3D | mnt.Vector3D_Array,
+    p1s: mnt.Point3D | mnt.Point3D_Array,
+    v1s: mnt.Vector3D | mnt.Vector3D_Array,
+    threshold: float = 1e-5,
+) -> mnt.Point3D | mnt.Point3D_Array:
+    """Find the intersections of pairs of lines.
+
+    Equivalent to ``manim.find_intersection()``, but operates on the arrays of points
+    and directions as a whole rather than pair by pair, and broadcasts, so that a
+    single line may be intersected with several.
+
+    Parameters
+    ----------
+    p0s, v0s : Point3D | Point3D_Array, Vector3D | Vector3D_Array
+        Points on and directions of the first line of each pair.
+    p1s, v1s : Point3D | Point3D_Array, Vector3D | Vector3D_Array
+        Points on and directions of the second line of each pair.
+    threshold : float
+        The minimum denominator to use, as in ``manim.find_intersection()``. Lines that
+        are (nearly) parallel result in the point on the first line being returned.
+
+    Returns
+    -------
+    Point3D | Point3D_Array
+        The points on the first line of each pair nearest to the second.
+    """
+    normal = np.cross(v1s, np.cross(v0s, v1s))
+    denominator = np.maximum(np.sum(v0s * normal, axis=-1), threshold)
+    scale = np.sum((p1s - p0s) * normal, axis=-1) / denominator
+    return p0s + scale[..., np.newaxis] * v0s
@@ -36,17 +36,21 @@ class Bipole(Component, metaclass=abc.ABCMeta):
         right: Terminal | None = None,
         **kwargs: Any,
     ) -> None:
-        half_width = config_eng.symbol.bipole_width / 2
-
         left = (
             left
             if left is not None
-            else Terminal(position=half_width * mn.LEFT, direction=mn.LEFT)
+            else Terminal(
+                position=config_eng.symbol._bipole_left_terminal_position,
+                direction=mn.LEFT,
+            )
         )
         right = (
             right
             if right is not None
-            else Terminal(position=half_width * mn.RIGHT, direction=mn.RIGHT)
+            else Terminal(
+                position=config_eng.symbol._bipole_right_terminal_position,
+                direction=mn.RIGHT,
+            )
         )
         super().__init__(terminals=[left, right], **kwargs)
 
@@ -93,16 +97,15 @@ class SquareBipole(Bipole, metaclass=abc.ABCMeta):
         right: Terminal | None = None,
         **kwargs: Any,
     ) -> None:
-        half_width = config_eng.symbol.square_bipole_side_length / 2
         super().__init__(
             Terminal(
-                position=mn.LEFT * half_width,
+                position=config_eng.symbol._square_bipole_left_terminal_position,
                 direction=mn.LEFT,
             )
             if left is None
             else left,
             Terminal(
-                position=mn.RIGHT * half_width,
+                position=config_eng.symbol._square_bipole_right_terminal_position,
                 direction=mn.RIGHT,
             )
             if right is None
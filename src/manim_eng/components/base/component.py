@@ -1,20 +1,29 @@
 """Contains the Component base class."""
 
 import abc
-from typing import Any, Self
+from typing import Any, Mapping, Self
 
 import manim as mn
 import manim.typing as mnt
+import numpy as np
 
 from manim_eng import config_eng
 from manim_eng._base.anchor import AnnotationAnchor, CentreAnchor, LabelAnchor
 from manim_eng._base.mark import Mark
 from manim_eng._base.markable import Markable
+from manim_eng._utils import utils
 from manim_eng.circuit.voltage import Voltage
 from manim_eng.components.base.terminal import Terminal
 
 __all__ = ["Component"]
 
+# A small amount is added to the label and annotation anchors to make sure that they are
+# never directly over the centre anchor, as this causes problems.
+_LABEL_ANCHOR_NUDGE = 0.01 * mn.UP
+_LABEL_ANCHOR_NUDGE.setflags(write=False)
+_ANNOTATION_ANCHOR_NUDGE = 0.01 * mn.DOWN
+_ANNOTATION_ANCHOR_NUDGE.setflags(write=False)
+
 
 class Component(Markable, metaclass=abc.ABCMeta):
     """Base class for all components.
@@ -50,8 +59,13 @@ class Component(Markable, metaclass=abc.ABCMeta):
         self._label_anchor = LabelAnchor()
         self._annotation_anchor = AnnotationAnchor()
 
+        # The anchors are added alongside the body (which must be in place before
+        # ``_construct()``) so that the component's children are added in one go. They
+        # are positioned once the body has been constructed.
         self._body = mn.VGroup()
-        self.add(self._body)
+        self.add(
+            self._body, self._centre_anchor, self._label_anchor, self._annotation_anchor
+        )
 
         self._construct()
 
@@ -86,7 +100,7 @@ class Component(Markable, metaclass=abc.ABCMeta):
         Point3D
             The centre of the components.
         """
-        return self._centre_anchor.get_center()
+        return self._centre_anchor.pos
 
     def set_label(self, label: str) -> Self:
         """Set the label of the component.
@@ -333,11 +347,22 @@ class Component(Markable, metaclass=abc.ABCMeta):
         return to_return
 
     def __set_up_anchors(self) -> None:
-        # A small amount is added to each of these anchors to make sure that they are
-        # never directly over the centre anchor, as this causes problems.
-        self._label_anchor.shift(self._body.get_top() + 0.01 * mn.UP)
-        self._annotation_anchor.shift(self._body.get_bottom() + 0.01 * mn.DOWN)
-        self.add(self._centre_anchor, self._label_anchor, self._annotation_anchor)
+        # Equivalent to ``self._body.get_top()`` and ``self._body.get_bottom()``, but
+        # gathering the body's boundary points only once for the two of them
+        top = np.zeros(3)
+        bottom = np.zeros(3)
+        boundary_points = self._body.get_points_defining_boundary()
+        if len(boundary_points) != 0:
+            minima = boundary_points.min(axis=0)
+            maxima = boundary_points.max(axis=0)
+            top[:] = bottom[:] = (minima + maxima) / 2
+            top[1] = maxima[1]
+            bottom[1] = minima[1]
+        # Both points are fresh arrays, so the nudges can be applied in place
+        top += _LABEL_ANCHOR_NUDGE
+        bottom += _ANNOTATION_ANCHOR_NUDGE
+        self._label_anchor.shift(top)
+        self._annotation_anchor.shift(bottom)
 
     def __initialise_marks(self, label: str | None, annotation: str | None) -> None:
         if label is not None:
@@ -347,34 +372,30 @@ class Component(Markable, metaclass=abc.ABCMeta):
 
     @mn.override_animate(set_label)
     def __animate_set_label(
-        self, label: str, anim_args: dict[str, Any] | None = None
+        self, label: str, anim_args: Mapping[str, Any] | None = None
     ) -> mn.Animation:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
         return self.animate(**anim_args)._set_mark(self._label, label).build()
 
     @mn.override_animate(clear_label)
     def __animate_clear_label(
-        self, anim_args: dict[str, Any] | None = None
+        self, anim_args: Mapping[str, Any] | None = None
     ) -> mn.Animation:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
         return self.animate(**anim_args)._clear_mark(self._label).build()
 
     @mn.override_animate(set_annotation)
     def __animate_set_annotation(
-        self, label: str, anim_args: dict[str, Any] | None = None
+        self, label: str, anim_args: Mapping[str, Any] | None = None
     ) -> mn.Animation:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
         return self.animate(**anim_args)._set_mark(self._annotation, label).build()
 
     @mn.override_animate(clear_annotation)
     def __animate_clear_annotation(
-        self, anim_args: dict[str, Any] | None = None
+        self, anim_args: Mapping[str, Any] | None = None
     ) -> mn.Animation:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
         return self.animate(**anim_args)._clear_mark(self._annotation).build()
 
     @mn.override_animate(set_current)
@@ -382,11 +403,10 @@ class Component(Markable, metaclass=abc.ABCMeta):
         self,
         label: str,
         terminal: Terminal | str | None = None,
-        anim_args: dict[str, Any] | None = None,
+        anim_args: Mapping[str, Any] | None = None,
         **kwargs: Any,
     ) -> mn.Animation:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
 
         terminal = self._get_or_check_terminal(terminal)
         return terminal.animate(**anim_args).set_current(label, **kwargs).build()
@@ -396,11 +416,10 @@ class Component(Markable, metaclass=abc.ABCMeta):
         self,
         label: str,
         terminal: Terminal | str | None = None,
-        anim_args: dict[str, Any] | None = None,
+        anim_args: Mapping[str, Any] | None = None,
         **kwargs: Any,
     ) -> mn.Animation:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
 
         terminal = self._get_or_check_terminal(terminal)
         return terminal.animate(**anim_args).reset_current(label, **kwargs).build()
@@ -409,10 +428,9 @@ class Component(Markable, metaclass=abc.ABCMeta):
     def __animate_clear_current(
         self,
         terminal: Terminal | str | None = None,
-        anim_args: dict[str, Any] | None = None,
+        anim_args: Mapping[str, Any] | None = None,
     ) -> mn.Animation:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
 
         terminal = self._get_or_check_terminal(terminal)
         return terminal.animate(**anim_args).clear_current().build()
@@ -64,11 +64,8 @@ class VariableModifier(Component, metaclass=abc.ABCMeta):
     def _construct(self) -> None:
         super()._construct()
 
-        component_width = float(
-            np.linalg.norm(self._body.get_right() - self._body.get_left())
-        )
-        component_height = float(
-            np.linalg.norm(self._body.get_bottom() - self._body.get_top())
+        component_width, component_height, body_centre = _get_extent_and_centre(
+            self._body
         )
 
         arrow_half_height = component_height * (
@@ -79,11 +76,10 @@ class VariableModifier(Component, metaclass=abc.ABCMeta):
         )
         arrow_half_width = 0.8 * arrow_half_height
 
+        arrow_half_diagonal = np.array([arrow_half_width, arrow_half_height, 0])
         arrow = mn.Arrow(
-            start=np.array([-arrow_half_width, -arrow_half_height, 0])
-            + self._body.get_center(),
-            end=np.array([arrow_half_width, arrow_half_height, 0])
-            + self._body.get_center(),
+            start=body_centre - arrow_half_diagonal,
+            end=body_centre + arrow_half_diagonal,
             buff=0,
             tip_length=config_eng.symbol.variability_arrow_tip_length,
             stroke_width=self.stroke_width,
@@ -108,11 +104,8 @@ class SensorModifier(Component, metaclass=abc.ABCMeta):
     def _construct(self) -> None:
         super()._construct()
 
-        component_width = float(
-            np.linalg.norm(self._body.get_right() - self._body.get_left())
-        )
-        component_height = float(
-            np.linalg.norm(self._body.get_bottom() - self._body.get_top())
+        component_width, component_height, body_centre = _get_extent_and_centre(
+            self._body
         )
 
         margin = config_eng.symbol.square_bipole_side_length * 0.2
@@ -142,7 +135,23 @@ class SensorModifier(Component, metaclass=abc.ABCMeta):
             mn.VMobject()
             .match_style(self)
             .set_points_as_corners([bottom_left, bottom_middle, top_right])
-            .move_to(self._body.get_center() - main_midpoint_offset)
+            .move_to(body_centre - main_midpoint_offset)
         )
 
         self._body.add(tick)
+
+
+def _get_extent_and_centre(body: mn.VGroup) -> tuple[float, float, np.ndarray]:
+    """Return the width, height and centre of a component body.
+
+    Equivalent to using ``get_left()``, ``get_right()``, ``get_top()``,
+    ``get_bottom()`` and ``get_center()``, but gathers the boundary points only once,
+    rather than for each of them.
+    """
+    boundary_points = body.get_points_defining_boundary()
+    if len(boundary_points) == 0:
+        return 0.0, 0.0, np.zeros(3)
+    minima = boundary_points.min(axis=0)
+    maxima = boundary_points.max(axis=0)
+    extent = maxima - minima
+    return float(extent[0]), float(extent[1]), (minima + maxima) / 2
@@ -1,12 +1,13 @@
 """Base classes for creating sources."""
 
 import abc
-from typing import Any, Self
+from typing import Any, Mapping, Self
 
 import manim as mn
 import numpy as np
 
 from manim_eng import config_eng
+from manim_eng._utils import utils
 from manim_eng.components.base.bipole import SquareBipole
 from manim_eng.components.base.terminal import Terminal
 
@@ -127,10 +128,9 @@ class VoltageSourceBase(Source, metaclass=abc.ABCMeta):
 
     @mn.override_animate(set_voltage)
     def __animate_set_voltage(
-        self, label: str, anim_args: dict[str, Any] | None = None
+        self, label: str, anim_args: Mapping[str, Any] | None = None
     ) -> mn.Animation:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
 
         label_animation = self.animate(**anim_args).set_label(label).build()
         animations = [label_animation]
@@ -144,10 +144,9 @@ class VoltageSourceBase(Source, metaclass=abc.ABCMeta):
 
     @mn.override_animate(clear_voltage)
     def __animate_clear_voltage(
-        self, anim_args: dict[str, Any] | None = None
+        self, anim_args: Mapping[str, Any] | None = None
     ) -> mn.Animation:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
 
         label_animation = self.animate(**anim_args).clear_label().build()
         animations = [label_animation]
@@ -1,12 +1,13 @@
 """Base class for switches and implementation helper class."""
 
 import abc
-from typing import Any, Self
+from typing import Any, Mapping, Self
 
 import manim as mn
 import numpy as np
 
 from manim_eng import config_eng
+from manim_eng._utils import utils
 from manim_eng.components.base.bipole import Bipole
 from manim_eng.components.base.terminal import Terminal
 
@@ -79,20 +80,18 @@ class BipoleSwitchBase(Bipole, metaclass=abc.ABCMeta):
 
     @mn.override_animate(toggle)
     def __animate_toggle(
-        self, anim_args: dict[str, Any] | None = None
+        self, anim_args: Mapping[str, Any] | None = None
     ) -> mn.Animation | None:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
         if self.closed:
             return self.animate(**anim_args).open().build()
         return self.animate(**anim_args).close().build()
 
     @mn.override_animate(set_closed)
     def __animate_set_closed(
-        self, closed: bool, anim_args: dict[str, Any] | None = None
+        self, closed: bool, anim_args: Mapping[str, Any] | None = None
     ) -> mn.Animation | None:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
         if closed:
             return self.animate(**anim_args).close().build()
         return self.animate(**anim_args).open().build()
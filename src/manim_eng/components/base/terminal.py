@@ -1,6 +1,8 @@
 """Terminal base class and implementation helper class."""
 
-from typing import Any, Self
+import functools
+import math
+from typing import Any, Mapping, Self
 
 import manim as mn
 import manim.typing as mnt
@@ -11,19 +13,52 @@ from manim_eng._base.anchor import CentreAnchor, CurrentAnchor, TerminalAnchor
 from manim_eng._base.mark import Mark
 from manim_eng._base.markable import Markable
 from manim_eng._config import config_eng
+from manim_eng._utils import utils
 
 __all__ = ["Terminal"]
 
+_OCTANT_TOLERANCE = 1e-9
+
 
 class CurrentArrow(mn.Triangle):
-    def __init__(self, position: mnt.Vector3D, rotation: float = 0) -> None:
+    def __init__(self, radius: float) -> None:
         super().__init__(
-            radius=config_eng.symbol.current_arrow_radius,
+            radius=radius,
             start_angle=0,
             color=mn.WHITE,
             fill_opacity=1,
         )
-        self.move_to(position).rotate(rotation, about_point=position)
+
+    @staticmethod
+    def at(position: mnt.Vector3D, rotation: float = 0) -> "CurrentArrow":
+        """Return a current arrow centred on ``position`` and rotated by ``rotation``.
+
+        The arrow is copied from a cached prototype rather than constructed afresh.
+        Rotations that are a multiple of 45 degrees (i.e. any terminal pointing in a
+        compass direction) use a prototype that has already been rotated.
+        """
+        radius = config_eng.symbol.current_arrow_radius
+        eighths = rotation / (mn.PI / 4)
+        octant = round(eighths)
+        if abs(eighths - octant) < _OCTANT_TOLERANCE:
+            arrow = _get_current_arrow_prototype(radius, octant % 8).copy()
+        else:
+            arrow = (
+                _get_current_arrow_prototype(radius, 0)
+                .copy()
+                .rotate(rotation, about_point=mn.ORIGIN)
+            )
+        return arrow.shift(position)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_current_arrow_prototype(radius: float, octant: int) -> CurrentArrow:
+    # Keyed on the radius so that a change in configuration produces new prototypes
+    return (
+        CurrentArrow(radius)
+        .move_to(mn.ORIGIN)
+        .rotate(octant * mn.PI / 4, about_point=mn.ORIGIN)
+    )
 
 
 class Terminal(Markable):
@@ -43,7 +78,13 @@ class Terminal(Markable):
     def __init__(self, position: mnt.Vector3D, direction: mnt.Vector3D) -> None:
         super().__init__()
 
-        direction /= np.linalg.norm(direction)
+        # Normalise without modifying the passed array in place, as callers regularly
+        # pass Manim's shared direction constants
+        direction = direction / math.sqrt(
+            direction[0] * direction[0]
+            + direction[1] * direction[1]
+            + direction[2] * direction[2]
+        )
         end = position + (direction * config_eng.symbol.terminal_length)
         self.line = mn.Line(
             start=position,
@@ -55,19 +96,27 @@ class Terminal(Markable):
         self._centre_anchor = CentreAnchor().move_to(self.line.get_center())
         self._end_anchor = TerminalAnchor().move_to(end)
 
+        self.__version: int = 0
+        self.__versioned_positions: list[float] | None = None
+        self.__direction: mnt.Vector3D
+        self.__direction_version: int = -1
+        self.__cardinal_direction: mnt.Vector3D
+        self.__cardinalised_direction: mnt.Vector3D | None = None
+
         self._current_arrow: CurrentArrow
         self._current_arrow_showing: bool = False
         self._current_arrow_pointing_out: bool = False
         self.__rebuild_current_arrow()
 
+        # The perpendicular (direction x IN) is written out in full to build the offset
+        # to the current anchors in a single allocation
         arrow_half_height = self._current_arrow.height / 2
-        perpendicular = np.cross(direction, mn.IN)
-        self._top_anchor = CurrentAnchor().move_to(
-            self._centre_anchor.pos + arrow_half_height * perpendicular
-        )
-        self._bottom_anchor = CurrentAnchor().move_to(
-            self._centre_anchor.pos - arrow_half_height * perpendicular
+        offset = np.array(
+            [-arrow_half_height * direction[1], arrow_half_height * direction[0], 0]
         )
+        centre = self._centre_anchor.pos
+        self._top_anchor = CurrentAnchor().move_to(centre + offset)
+        self._bottom_anchor = CurrentAnchor().move_to(centre - offset)
 
         self.add(
             self._centre_anchor, self._end_anchor, self._top_anchor, self._bottom_anchor
@@ -76,10 +125,50 @@ class Terminal(Markable):
         self._current: Mark = Mark(self._top_anchor, self._centre_anchor)
         self._current_mark_anchored_below: bool = False
 
+    def _refresh_version(self) -> int:
+        """Return a counter that increases whenever the terminal has moved.
+
+        Anything derived from the end or direction of the terminal can be cached
+        against this value (along with the terminal itself). Each call reads the
+        positions of the terminal's end and centre anchors and compares them by value
+        with those seen by the previous call, increasing the counter if they differ.
+        This costs two small list conversions and a comparison of six floats, so
+        callers should call it once per update and reuse the result.
+        """
+        # Compared by value, as some transforms (e.g. ``stretch()``) modify a mobject's
+        # points in place
+        positions = [
+            *self._end_anchor.points[0].tolist(),
+            *self._centre_anchor.points[0].tolist(),
+        ]
+        if positions != self.__versioned_positions:
+            self.__version += 1
+            self.__versioned_positions = positions
+        return self.__version
+
     @property
     def direction(self) -> mnt.Vector3D:
         """Return the direction of the terminal as a normalised vector."""
-        return mn.normalize(self._end_anchor.pos - self._centre_anchor.pos)
+        version = self._refresh_version()
+        if version != self.__direction_version:
+            self.__direction = utils.normalised(
+                self._end_anchor.pos - self._centre_anchor.pos
+            )
+            self.__direction.setflags(write=False)
+            self.__direction_version = version
+        return self.__direction
+
+    @property
+    def cardinal_direction(self) -> mnt.Vector3D:
+        """Return the direction of the terminal snapped to the nearest cardinal one."""
+        # ``direction`` returns the same array until it has to be recomputed, so the
+        # snapped direction only needs recomputing if that array changes
+        direction = self.direction
+        if direction is not self.__cardinalised_direction:
+            self.__cardinal_direction = utils.cardinalised(direction)
+            self.__cardinal_direction.setflags(write=False)
+            self.__cardinalised_direction = direction
+        return self.__cardinal_direction
 
     @property
     def end(self) -> mnt.Point3D:
@@ -191,10 +280,11 @@ class Terminal(Markable):
         Useful after an Uncreate or a rotation when the arrow wasn't in the scene (and
         therefore wasn't rotated).
         """
-        angle_to_rotate = mn.angle_of_vector(self.direction)
+        direction = self.direction
+        angle_to_rotate = math.atan2(direction[1], direction[0])
         if not self._current_arrow_pointing_out:
             angle_to_rotate += np.pi
-        self._current_arrow = CurrentArrow(self._centre_anchor.pos, angle_to_rotate)
+        self._current_arrow = CurrentArrow.at(self._centre_anchor.pos, angle_to_rotate)
 
     @mn.override_animate(set_current)
     def __animate_set_current(
@@ -202,10 +292,9 @@ class Terminal(Markable):
         label: str,
         out: bool | None = None,
         below: bool | None = None,
-        anim_args: dict[str, Any] | None = None,
+        anim_args: Mapping[str, Any] | None = None,
     ) -> mn.Animation:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
 
         animations: list[mn.Animation] = []
 
@@ -251,10 +340,9 @@ class Terminal(Markable):
         label: str,
         out: bool = False,
         below: bool = False,
-        anim_args: dict[str, Any] | None = None,
+        anim_args: Mapping[str, Any] | None = None,
     ) -> mn.Animation:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
         return (
             self.animate(**anim_args)
             .set_current(label=label, out=out, below=below)
@@ -263,10 +351,9 @@ class Terminal(Markable):
 
     @mn.override_animate(clear_current)
     def __animate_clear_current(
-        self, anim_args: dict[str, Any] | None = None
+        self, anim_args: Mapping[str, Any] | None = None
     ) -> mn.Animation:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
 
         arrow_animation = mn.Uncreate(self._current_arrow, **anim_args)
         self._current_arrow_showing = False
@@ -1,5 +1,7 @@
 """Component symbols of resistor-based components."""
 
+import functools
+
 import manim as mn
 
 from manim_eng._config import config_eng
@@ -15,12 +17,12 @@ class Resistor(Bipole):
 
     def _construct(self) -> None:
         super()._construct()
-        box = mn.Rectangle(
-            width=config_eng.symbol.bipole_width,
-            height=config_eng.symbol.bipole_height,
-            stroke_width=config_eng.symbol.component_stroke_width,
-        ).match_style(self)
-        self._body.add(box)
+        box = _get_box_prototype(
+            config_eng.symbol.bipole_width,
+            config_eng.symbol.bipole_height,
+            config_eng.symbol.component_stroke_width,
+        )
+        self._body.add(box.copy().match_style(self))
 
 
 class Thermistor(SensorModifier, Resistor):
@@ -35,3 +37,11 @@ class VariableResistor(VariableModifier, Resistor):
 
     def _construct(self) -> None:
         super()._construct()
+
+
+@functools.lru_cache(maxsize=8)
+def _get_box_prototype(
+    width: float, height: float, stroke_width: float
+) -> mn.Rectangle:
+    # Keyed on the dimensions so that a change in configuration produces new prototypes
+    return mn.Rectangle(width=width, height=height, stroke_width=stroke_width)
@@ -1,10 +1,11 @@
 """Component symbols of switches (both lever-arm and push-button)."""
 
-from typing import Any, Self
+from typing import Any, Mapping, Self
 
 import manim as mn
 
 from manim_eng import config_eng
+from manim_eng._utils import utils
 from manim_eng.components.base.switch import BipoleSwitchBase, PushSwitchBase
 
 __all__ = ["Switch", "PushToBreakSwitch", "PushToMakeSwitch"]
@@ -63,10 +64,9 @@ class Switch(BipoleSwitchBase):
 
     @mn.override_animate(open)
     def __animate_open(
-        self, anim_args: dict[str, Any] | None = None
+        self, anim_args: Mapping[str, Any] | None = None
     ) -> mn.Animation | None:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
         if not self.closed:
             return None
         self.closed = False
@@ -79,10 +79,9 @@ class Switch(BipoleSwitchBase):
 
     @mn.override_animate(close)
     def __animate_close(
-        self, anim_args: dict[str, Any] | None = None
+        self, anim_args: Mapping[str, Any] | None = None
     ) -> mn.Animation | None:
-        if anim_args is None:
-            anim_args = {}
+        anim_args = anim_args or utils.EMPTY_ANIM_ARGS
         if self.closed:
             return None
         self.closed = True
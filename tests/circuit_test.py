@@ -1,5 +1,5 @@
 import pytest
-from manim_eng import Circuit
+from manim_eng import Circuit, Wire
 
 from .test_utils.dummy_component import DummyComponent
 
@@ -53,6 +53,21 @@ def test_connect_throws_error_if_terminals_do_not_belong_to_components_in_the_ci
         circuit.animate.connect(dummy_component.terminal_1, dummy_component.terminal_2)
 
 
+def test_connect_throws_error_if_terminals_belong_to_a_removed_component() -> None:
+    component_1 = DummyComponent()
+    component_2 = DummyComponent()
+    circuit = Circuit(component_1, component_2)
+
+    circuit.remove(component_2)
+
+    with pytest.raises(
+        ValueError,
+        match="At least one passed terminal does not "
+        "belong to any component in this circuit",
+    ):
+        circuit.connect(component_1.terminal_1, component_2.terminal_1)
+
+
 def test_disconnect() -> None:
     component_1 = DummyComponent()
     component_2 = DummyComponent()
@@ -93,6 +108,20 @@ def test_disconnect_throws_error_if_terminals_do_not_belong_to_components_in_cir
         )
 
 
+def test_disconnect_and_isolate_remove_adjacent_matching_wires() -> None:
+    component_1 = DummyComponent()
+    component_2 = DummyComponent()
+    circuit = Circuit(component_1, component_2)
+    for current_circuit_method in [circuit.disconnect, circuit.isolate]:
+        circuit.connect(component_1.terminal_1, component_2.terminal_1).connect(
+            component_1.terminal_2, component_2.terminal_2
+        ).connect(component_1.terminal_1, component_2.terminal_2)
+
+        current_circuit_method(component_1, component_2)
+
+        assert len(circuit.wires.submobjects) == 0
+
+
 def test_isolate() -> None:
     component_1 = DummyComponent()
     component_2 = DummyComponent()
@@ -115,6 +144,47 @@ def test_isolate() -> None:
         assert submobjects[0].to_terminal == component_3.terminal_2
 
 
+def test_disconnect_ignores_wires_removed_directly_from_wires() -> None:
+    component_1 = DummyComponent()
+    component_2 = DummyComponent()
+    circuit = Circuit(component_1, component_2)
+    circuit.connect(component_1.terminal_1, component_2.terminal_1).connect(
+        component_1.terminal_2, component_2.terminal_2
+    )
+    removed_wire, remaining_wire = circuit.wires.submobjects
+    circuit.wires.remove(removed_wire)
+
+    animation = circuit.animate.disconnect(component_1, component_2).build()
+
+    assert [uncreate.mobject for uncreate in animation.animations] == [remaining_wire]
+    assert len(circuit.wires.submobjects) == 0
+
+
+def test_isolate_removes_wires_added_directly_to_wires() -> None:
+    component_1 = DummyComponent()
+    component_2 = DummyComponent()
+    circuit = Circuit(component_1, component_2)
+    circuit.wires.add(Wire(component_1.terminal_1, component_2.terminal_1))
+
+    circuit.isolate(component_1)
+
+    assert len(circuit.wires.submobjects) == 0
+
+
+def test_animate_isolate_uncreates_wires_in_circuit_order() -> None:
+    component_1 = DummyComponent()
+    component_2 = DummyComponent()
+    circuit = Circuit(component_1, component_2)
+    circuit.connect(component_1.terminal_2, component_2.terminal_1).connect(
+        component_1.terminal_1, component_2.terminal_2
+    ).connect(component_1.terminal_1, component_2.terminal_1)
+    wires = list(circuit.wires.submobjects)
+
+    animation = circuit.animate.isolate(component_1).build()
+
+    assert [uncreate.mobject for uncreate in animation.animations] == wires
+
+
 def test_isolate_throws_error_if_terminals_do_not_belong_to_components_in_the_circuit(
     dummy_component: DummyComponent,
 ) -> None:
@@ -166,9 +236,9 @@ def test_collapse_components_and_terminals_removes_duplicates() -> None:
     assert set(terminals) == set(expected)
 
 
-def test_collapse_components_and_terminals_returns_empty_list_with_empty_input() -> (
+def test_collapse_components_and_terminals_returns_empty_set_with_empty_input() -> (
     None
 ):
     terminals = Circuit._collapse_components_and_terminals_to_terminals([])
 
-    assert terminals == []
+    assert terminals == set()
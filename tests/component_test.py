@@ -1,4 +1,6 @@
+import numpy as np
 import pytest
+from manim_eng import Switch
 from manim_eng.components.base.component import Component
 
 from .test_utils.dummy_component import DummyComponent, DummyComponentMockedTerminals
@@ -85,6 +87,17 @@ def test_voltage_sets_component_it_is_called_on_as_avoid(
     assert voltage.component_to_avoid == dummy_component
 
 
+def test_voltage_arrow_follows_avoided_switch_being_toggled() -> None:
+    switch = Switch(closed=True)
+    voltage = switch.voltage("left", "right", "V", clockwise=True)
+    arrow_points = voltage._arrow.points.copy()
+
+    switch.open()
+    voltage.update()
+
+    assert not np.array_equal(voltage._arrow.points, arrow_points)
+
+
 def test_voltage_errors_if_terminals_are_the_same(
     dummy_component: DummyComponent,
 ) -> None:
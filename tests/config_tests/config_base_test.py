@@ -4,7 +4,8 @@ from typing import Any
 
 import manim as mn
 import pytest
-from manim_eng._config.config import ConfigBase
+import numpy as np
+from manim_eng._config.config import ComponentSymbolConfig, ConfigBase
 
 
 @dc.dataclass
@@ -352,6 +353,35 @@ def test_as_dict(test_config: TestConfigRoot) -> None:
     assert actual == expected
 
 
+def test_load_from_dict_updates_derived_values() -> None:
+    symbol_config = ComponentSymbolConfig()
+
+    symbol_config.load_from_dict({"bipole_width": 3.0})
+
+    assert np.allclose(symbol_config._bipole_left_terminal_position, [-1.5, 0, 0])
+    assert np.allclose(symbol_config._bipole_right_terminal_position, [1.5, 0, 0])
+
+
+def test_assignment_updates_derived_values() -> None:
+    symbol_config = ComponentSymbolConfig()
+
+    symbol_config.square_bipole_side_length = 2.0
+
+    assert np.allclose(
+        symbol_config._square_bipole_left_terminal_position, [-1.0, 0, 0]
+    )
+    assert np.allclose(
+        symbol_config._square_bipole_right_terminal_position, [1.0, 0, 0]
+    )
+
+
+def test_load_from_dict_rejects_derived_values() -> None:
+    symbol_config = ComponentSymbolConfig()
+
+    with pytest.raises(ValueError, match="Invalid key"):
+        symbol_config.load_from_dict({"_bipole_left_terminal_position": [0, 0, 0]})
+
+
 @pytest.mark.parametrize(
     ("variable", "expected"),
     [
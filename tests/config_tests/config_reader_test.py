@@ -1,27 +1,41 @@
 import os
+from typing import Generator
 from unittest import mock
 
 import pytest
 from manim_eng._config.config_readers import (
     UnsupportedOsTypeError,
+    _load_user_config,
     get_project_config,
     get_user_config,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_user_config_cache() -> Generator:
+    _load_user_config.cache_clear()
+    yield
+    _load_user_config.cache_clear()
+
+
 def replace_os_path_expanduser(path: str) -> str:
     if path == "~":
         return "USERHOME"
     return os.path.expanduser(path)
 
 
+def every_path_is_a_file(_path: str) -> bool:
+    return True
+
+
 @mock.patch("os.name", "posix")
-@mock.patch("tomllib.load", return_value={})
+@mock.patch("tomllib.loads", return_value={})
 @mock.patch("os.path.expanduser", replace_os_path_expanduser)
+@mock.patch("os.path.isfile", every_path_is_a_file)
 @mock.patch("builtins.open")
 def test_get_user_config_config_file_correct_path_posix(
     open_mocked: mock.MagicMock,
-    _tomllib_load_mocked: mock.MagicMock,  # noqa: PT019
+    _tomllib_loads_mocked: mock.MagicMock,  # noqa: PT019
 ) -> None:
     _ = get_user_config()
 
@@ -29,12 +43,13 @@ def test_get_user_config_config_file_correct_path_posix(
 
 
 @mock.patch("os.name", "nt")
-@mock.patch("tomllib.load", return_value={})
+@mock.patch("tomllib.loads", return_value={})
 @mock.patch("os.path.expanduser", replace_os_path_expanduser)
+@mock.patch("os.path.isfile", every_path_is_a_file)
 @mock.patch("builtins.open")
 def test_get_user_config_config_file_correct_path_windows(
     open_mocked: mock.MagicMock,
-    _tomllib_load_mocked: mock.MagicMock,  # noqa: PT019
+    _tomllib_loads_mocked: mock.MagicMock,  # noqa: PT019
 ) -> None:
     _ = get_user_config()
 
@@ -61,12 +76,28 @@ def test_get_user_config_file_not_found_returns_empty_dict(
     assert result == {}
 
 
+@mock.patch("tomllib.loads", return_value={"debug": True})
+@mock.patch("os.path.isfile", every_path_is_a_file)
+@mock.patch("builtins.open")
+def test_get_user_config_only_reads_file_once(
+    open_mocked: mock.MagicMock,
+    _tomllib_loads_mocked: mock.MagicMock,  # noqa: PT019
+) -> None:
+    first = get_user_config()
+    second = get_user_config()
+
+    open_mocked.assert_called_once()
+    assert first == second == {"debug": True}
+    assert first is not second
+
+
 @mock.patch("os.getcwd", return_value="CWD")
-@mock.patch("tomllib.load", return_value={})
+@mock.patch("tomllib.loads", return_value={})
+@mock.patch("os.path.isfile", every_path_is_a_file)
 @mock.patch("builtins.open")
 def test_get_project_config_attempts_to_open_the_correct_file(
     open_mocked: mock.MagicMock,
-    _tomllib_load_mocked: mock.MagicMock,  # noqa: PT019
+    _tomllib_loads_mocked: mock.MagicMock,  # noqa: PT019
     _os_getcwd_mocked: mock.MagicMock,  # noqa: PT019
 ) -> None:
     get_project_config()
@@ -81,3 +112,15 @@ def test_get_project_config_file_not_found_returns_empty_dict(
     result = get_project_config()
 
     assert result == {}
+
+
+@mock.patch("os.path.isfile", return_value=False)
+@mock.patch("builtins.open")
+def test_get_project_config_does_not_open_missing_file(
+    open_mocked: mock.MagicMock,
+    _isfile_mocked: mock.MagicMock,  # noqa: PT019
+) -> None:
+    result = get_project_config()
+
+    open_mocked.assert_not_called()
+    assert result == {}
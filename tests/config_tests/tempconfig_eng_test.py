@@ -1,5 +1,6 @@
 import copy
 
+import pytest
 from manim_eng._config import config_eng, tempconfig_eng
 
 
@@ -11,3 +12,15 @@ def test_tempconfig_eng() -> None:
         assert config_eng.symbol.bipole_height == 1000.0  # noqa: PLR2004
 
     assert config_eng == original
+
+
+def test_tempconfig_eng_restores_config_after_invalid_key() -> None:
+    original = copy.deepcopy(config_eng)
+
+    with (
+        pytest.raises(ValueError, match="Invalid key"),
+        tempconfig_eng({"debug": True, "not_a_key": 1}),
+    ):
+        pass
+
+    assert config_eng == original
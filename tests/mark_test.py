@@ -1,10 +1,11 @@
 from unittest import mock
 
+import manim as mn
 import numpy as np
 import pytest
 from manim_eng._base.anchor import Anchor
 from manim_eng._base.mark import Mark
-from manim_eng._config import config_eng
+from manim_eng._config import config_eng, tempconfig_eng
 
 
 def mock_anchor(x: float, y: float, z: float) -> Anchor:
@@ -46,6 +47,15 @@ def test_mark_can_have_other_font_size_set(mark_mocked_anchors: Mark) -> None:
     assert np.isclose(mark_mocked_anchors.mathtex.font_size, font_size)
 
 
+def test_mark_default_font_size_follows_config(mark_mocked_anchors: Mark) -> None:
+    font_size = 20.0
+
+    with tempconfig_eng({"symbol": {"mark_font_size": font_size}}):
+        mark_mocked_anchors.set_text("B")
+
+    assert np.isclose(mark_mocked_anchors.mathtex.font_size, font_size)
+
+
 def test_mark_attach_requires_anchor_and_centre_reference_to_be_different(
     anchor_mock: Anchor,
 ) -> None:
@@ -89,3 +99,50 @@ def test_set_text_text_set_already(mark_mocked_anchors: Mark) -> None:
 
     add_patcher.stop()
     remove_patcher.stop()
+
+
+def test_marks_with_same_text_do_not_share_mathtex(
+    anchor_mock: Anchor, centre_reference_mock: Anchor
+) -> None:
+    mark_1 = Mark(anchor_mock, centre_reference_mock)
+    mark_2 = Mark(anchor_mock, centre_reference_mock)
+
+    mark_1.set_text("F")
+    mark_2.set_text("F")
+
+    assert mark_1.mathtex is not mark_2.mathtex
+    assert mark_1.mathtex.tex_strings == mark_2.mathtex.tex_strings == ["F"]
+
+
+def test_mark_follows_anchor_when_it_moves(
+    mark_mocked_anchors: Mark, anchor_mock: Anchor
+) -> None:
+    mark_mocked_anchors.set_text("G")
+
+    anchor_mock.pos = np.array([3, 0, 0])
+    mark_mocked_anchors.update()
+
+    assert mark_mocked_anchors.get_left()[0] == pytest.approx(3 + mn.SMALL_BUFF)
+
+
+def test_mark_is_not_repositioned_if_nothing_has_moved(
+    mark_mocked_anchors: Mark,
+) -> None:
+    mark_mocked_anchors.set_text("H")
+    points = mark_mocked_anchors.family_members_with_points()[0].points
+
+    mark_mocked_anchors.update()
+
+    assert mark_mocked_anchors.family_members_with_points()[0].points is points
+
+
+def test_mark_is_repositioned_after_being_shifted_in_place(
+    mark_mocked_anchors: Mark,
+) -> None:
+    mark_mocked_anchors.set_text("I")
+
+    mark_mocked_anchors.shift(mn.UP)
+    mark_mocked_anchors.update()
+
+    assert mark_mocked_anchors.get_left()[0] == pytest.approx(1 + mn.SMALL_BUFF)
+    assert mark_mocked_anchors.get_center()[1] == pytest.approx(0)
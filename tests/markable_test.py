@@ -54,3 +54,26 @@ def test_clear_mark_mark_not_present(markable_dummy: SubclassesMarkable) -> None
         markable_dummy._clear_mark(markable_dummy.mark)
 
         patched_remove.assert_not_called()
+
+
+def test_add_adds_each_plain_mobject_once(markable_dummy: SubclassesMarkable) -> None:
+    mobjects = [mn.VMobject(), mn.VMobject(), mn.VMobject()]
+
+    with mock.patch.object(mn.VGroup, "add") as patched_add:
+        markable_dummy.add(*mobjects)
+
+        patched_add.assert_called_once_with(*mobjects)
+
+
+def test_animate_set_mark_with_unchanged_text_does_not_transform_mark(
+    markable_dummy: SubclassesMarkable,
+) -> None:
+    label = "E"
+    markable_dummy._set_mark(markable_dummy.mark, label)
+    markable_dummy.mark.tex_strings = [label]
+
+    animate_set_mark = markable_dummy._Markable__animate_set_mark  # type: ignore
+    animation = animate_set_mark(markable_dummy.mark, label)
+
+    assert isinstance(animation, mn.Wait)
+    markable_dummy.mark.generate_target.assert_not_called()
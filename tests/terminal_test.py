@@ -0,0 +1,70 @@
+import manim as mn
+import numpy as np
+from manim_eng.components.base.terminal import Terminal
+
+
+def test_direction_is_normalised() -> None:
+    terminal = Terminal(mn.ORIGIN, np.array([3.0, 0.0, 0.0]))
+
+    assert np.allclose(terminal.direction, mn.RIGHT)
+
+
+def test_direction_follows_rotation_of_parent() -> None:
+    terminal = Terminal(mn.ORIGIN, mn.RIGHT)
+    parent = mn.VGroup(terminal)
+    _ = terminal.direction
+
+    parent.rotate(mn.PI / 2, about_point=mn.ORIGIN)
+
+    assert np.allclose(terminal.direction, mn.UP)
+
+
+def test_direction_unaffected_by_shift() -> None:
+    terminal = Terminal(mn.ORIGIN, mn.LEFT)
+
+    terminal.shift(2 * mn.UP)
+
+    assert np.allclose(terminal.direction, mn.LEFT)
+
+
+def test_cardinal_direction_snaps_to_nearest_cardinal_direction() -> None:
+    terminal = Terminal(mn.ORIGIN, np.array([1.0, 3.0, 0.0]))
+
+    assert np.allclose(terminal.cardinal_direction, mn.UP)
+
+
+def test_cardinal_direction_follows_rotation_of_parent() -> None:
+    terminal = Terminal(mn.ORIGIN, mn.RIGHT)
+    parent = mn.VGroup(terminal)
+    _ = terminal.cardinal_direction
+
+    parent.rotate(mn.PI, about_point=mn.ORIGIN)
+
+    assert np.allclose(terminal.cardinal_direction, mn.LEFT)
+
+
+def test_version_unchanged_while_terminal_is_static() -> None:
+    terminal = Terminal(mn.ORIGIN, mn.RIGHT)
+    version = terminal._refresh_version()
+
+    _ = terminal.direction
+
+    assert terminal._refresh_version() == version
+
+
+def test_version_increases_when_terminal_moves() -> None:
+    terminal = Terminal(mn.ORIGIN, mn.RIGHT)
+    version = terminal._refresh_version()
+
+    terminal.shift(mn.UP)
+
+    assert terminal._refresh_version() > version
+
+
+def test_direction_follows_in_place_stretch() -> None:
+    terminal = Terminal(mn.ORIGIN, mn.RIGHT)
+    _ = terminal.direction
+
+    terminal.stretch(-1, dim=0, about_point=mn.ORIGIN)
+
+    assert np.allclose(terminal.direction, mn.LEFT)
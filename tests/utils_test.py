@@ -97,3 +97,20 @@ def test_cardinalised_no_margin_given(
     result = utils.cardinalised(vector)
 
     assert np.allclose(result, expected)
+
+
+@pytest.mark.parametrize(
+    ("vector", "expected"),
+    [
+        pytest.param([3, 0, 0], [1, 0, 0], id="axis-aligned"),
+        pytest.param([3, -4, 0], [0.6, -0.8, 0], id="diagonal"),
+        pytest.param([0, 0, 0], [0, 0, 0], id="zero vector"),
+    ],
+)
+def test_normalised(vector: list[float], expected: list[float]) -> None:
+    vector_original = copy.deepcopy(vector)
+
+    result = utils.normalised(vector)
+
+    assert np.allclose(result, expected)
+    assert np.all(vector == vector_original)
@@ -1,6 +1,6 @@
 import manim as mn
 import pytest
-from manim_eng import ManualWire, Wire
+from manim_eng import ManualWire, Wire, config_eng
 from manim_eng.components.base.terminal import Terminal
 
 
@@ -24,3 +24,74 @@ def test_manual_wire_throws_value_error_if_terminals_are_identical() -> None:
         r"Wires must have different terminals at each end\.",
     ):
         ManualWire(terminal, terminal, [])
+
+
+def test_wire_follows_terminal_after_it_moves() -> None:
+    from_terminal = Terminal(mn.LEFT, mn.LEFT)
+    to_terminal = Terminal(mn.RIGHT, mn.RIGHT)
+    wire = Wire(from_terminal, to_terminal)
+
+    to_terminal.shift(mn.UP)
+    wire.update()
+
+    assert wire.get_top()[1] == pytest.approx(to_terminal.end[1])
+
+
+def test_wire_is_not_reconstructed_if_terminals_have_not_moved() -> None:
+    wire = Wire(Terminal(mn.LEFT, mn.LEFT), Terminal(mn.RIGHT, mn.RIGHT))
+    points_before = wire.points
+
+    wire.update()
+
+    assert wire.points is points_before
+
+
+def test_wire_is_reconstructed_if_moved_away_from_its_terminals() -> None:
+    from_terminal = Terminal(mn.LEFT, mn.LEFT)
+    wire = Wire(from_terminal, Terminal(mn.RIGHT, mn.RIGHT))
+
+    wire.shift(mn.DOWN)
+    wire.update()
+
+    assert wire.get_center()[1] == pytest.approx(from_terminal.end[1])
+
+
+def test_wire_keeps_corner_point_coinciding_with_terminal_end() -> None:
+    terminal_length = config_eng.symbol.terminal_length
+    from_terminal = Terminal(mn.ORIGIN, mn.RIGHT)
+    to_terminal = Terminal(terminal_length * mn.RIGHT + 3 * mn.DOWN, mn.UP)
+    wire = Wire(from_terminal, to_terminal)
+
+    # One cubic curve per segment between the vertices, including the two short
+    # segments extending into the terminals
+    assert len(wire.points) == 4 * (len(wire.get_corner_points()) + 3)
+
+
+def test_wire_between_collinear_terminals_keeps_every_vertex() -> None:
+    from_terminal = Terminal(2 * mn.LEFT, mn.RIGHT)
+    to_terminal = Terminal(2 * mn.RIGHT, mn.LEFT)
+    wire = Wire(from_terminal, to_terminal)
+
+    assert len(wire.points) == 4 * (len(wire.get_corner_points()) + 3)
+
+
+def test_wire_between_perpendicular_terminals_turns_once_in_front_of_both() -> None:
+    from_terminal = Terminal(mn.ORIGIN, mn.RIGHT)
+    to_terminal = Terminal(3 * mn.RIGHT + 3 * mn.DOWN, mn.UP)
+    wire = Wire(from_terminal, to_terminal)
+
+    (corner_point,) = wire.get_corner_points()
+
+    assert corner_point[0] == pytest.approx(to_terminal.end[0])
+    assert corner_point[1] == pytest.approx(from_terminal.end[1])
+
+
+def test_wire_between_perpendicular_terminals_avoids_turning_back() -> None:
+    from_terminal = Terminal(mn.ORIGIN, mn.RIGHT)
+    to_terminal = Terminal(3 * mn.RIGHT + 3 * mn.DOWN, mn.DOWN)
+    wire = Wire(from_terminal, to_terminal)
+
+    (corner_point,) = wire.get_corner_points()
+
+    assert corner_point[0] == pytest.approx(from_terminal.end[0])
+    assert corner_point[1] == pytest.approx(to_terminal.end[1])